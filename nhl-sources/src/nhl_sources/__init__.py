@@ -0,0 +1,22 @@
+from nhl_sources.records import PlayerRecord
+from nhl_sources.result_cache import CacheInfo, ResultCache
+from nhl_sources.text import parse_text
+from nhl_sources.json_stream import JsonArrayStream, parse_json
+from nhl_sources.snapshot import Snapshot, write_snapshot
+from nhl_sources.sources import SnapshotSource, SourceReader, StreamSource, open_source, parse_any
+
+__all__ = [
+    "PlayerRecord",
+    "CacheInfo",
+    "ResultCache",
+    "parse_text",
+    "parse_json",
+    "parse_any",
+    "JsonArrayStream",
+    "Snapshot",
+    "write_snapshot",
+    "StreamSource",
+    "SnapshotSource",
+    "SourceReader",
+    "open_source"
+]
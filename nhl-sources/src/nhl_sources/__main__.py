@@ -0,0 +1,17 @@
+import sys
+
+from nhl_sources.snapshot import write_snapshot
+from nhl_sources.sources import open_source
+
+
+def main():
+    if len(sys.argv) != 3:
+        print("usage: python -m nhl_sources <players.txt|players.json|url> <output.snap>")
+        sys.exit(1)
+
+    count = write_snapshot(open_source(sys.argv[1]).records(), sys.argv[2])
+    print(f"{count} players written to {sys.argv[2]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import codecs
+import json
+import re
+from nhl_sources.records import PlayerRecord
+
+SEPARATORS = re.compile(r"[ \t\r\n,]*")
+NUMBER_TAIL = re.compile(r"[0-9.eE+-]*")
+LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+
+
+# antaa JSON-taulukon alkiot sitä mukaa kuin ne saapuvat
+class JsonArrayStream:
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._state = "start"
+
+    def _feed(self, chunk):
+        self._buffer = self._buffer[self._position:] + self._text.decode(chunk)
+        self._position = 0
+
+    def _skip_separators(self):
+        self._position = SEPARATORS.match(self._buffer, self._position).end()
+
+    def _enter_or_leave(self, current):
+        if self._state == "start":
+            if current != "[":
+                raise ValueError("expected a JSON array")
+            self._state = "items"
+            self._position += 1
+            self._skip()
+        elif self._state == "items" and current == "]":
+            self._state = "end"
+
+    def _skip(self):
+        self._skip_separators()
+
+        if self._position < len(self._buffer):
+            self._enter_or_leave(self._buffer[self._position])
+
+    def _truncated(self, error):
+        # vain puskurin loppuun katkennut alkio voi vielä valmistua; muu virhe on pysyvä
+        rest = self._buffer[error.pos:]
+
+        if error.msg.startswith("Unterminated string"):
+            return True
+        if error.msg.startswith("Invalid \\uXXXX escape"):
+            # myös sijaisparin ensimmäinen puolisko voi odottaa toista
+            return len(rest) <= len("uXXXX\\uXXXX")
+
+        return error.pos >= len(self._buffer) - 1 or any(literal.startswith(rest) for literal in LITERALS)
+
+    def _next_value(self):
+        # keskeneräinen alkio jää puskuriin odottamaan seuraavaa palaa
+        self._skip()
+
+        if self._state != "items" or self._position >= len(self._buffer):
+            return None
+
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._position)
+        except json.JSONDecodeError as error:
+            if not self._truncated(error):
+                raise
+            return None
+
+        # alkio on valmis vasta, kun sen perässä on erotin tai taulukon loppu
+        if end >= len(self._buffer):
+            return None
+        if self._buffer[end] not in " \t\r\n,]":
+            # luku voi jatkua seuraavassa palassa (1 | e+308); muu merkki on virhe
+            if NUMBER_TAIL.fullmatch(self._buffer, end):
+                return None
+            raise json.JSONDecodeError("Expecting ',' delimiter", self._buffer, end)
+
+        self._position = end
+        return (value,)
+
+    def _values(self):
+        item = self._next_value()
+
+        while item is not None:
+            yield item[0]
+            item = self._next_value()
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            self._feed(chunk)
+            yield from self._values()
+
+        self._feed(b"")
+
+        if self._state != "end":
+            raise ValueError("JSON array ended unexpectedly")
+
+
+def parse_json(chunks, factory=PlayerRecord):
+    for player in JsonArrayStream(chunks):
+        yield factory(
+            player["name"],
+            player["team"],
+            player.get("nationality", ""),
+            player["goals"],
+            player["assists"]
+        )
@@ -0,0 +1,4 @@
+from collections import namedtuple
+
+# kaikkien lähteiden yhteinen rivimuoto; projektit tekevät riveistä omat Player-oliot
+PlayerRecord = namedtuple("PlayerRecord", ["name", "team", "nationality", "goals", "assists"])
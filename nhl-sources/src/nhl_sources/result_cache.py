@@ -0,0 +1,69 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "size", "max_size"])
+
+
+class ResultCache:
+    # LRU-välimuisti, jonka tulokset ovat voimassa vain saman dataversion ajan
+    def __init__(self, max_size=128):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _lookup(self, key, version):
+        entry = self._entries.get(key)
+
+        # vanhemman dataversion tulos on sama kuin puuttuva tulos
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        return None
+
+    def get(self, key, version, compute):
+        # laskenta tehdään lukon ulkopuolella, jotta rinnakkaiset kyselyt eivät odota toisiaan
+        with self._lock:
+            entry = self._lookup(key, version)
+
+        if entry is not None:
+            return entry[1]
+
+        value = compute()
+
+        with self._lock:
+            self._store(key, version, value)
+
+        return value
+
+    def _store(self, key, version, value):
+        if self.max_size <= 0:
+            return
+
+        self._entries[key] = (version, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.evictions, len(self._entries), self.max_size)
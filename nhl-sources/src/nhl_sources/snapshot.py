@@ -0,0 +1,147 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from nhl_sources.records import PlayerRecord
+
+# tiedoston luvut ovat aina little-endian-muotoisia, joten mmap-näkymät
+# voidaan avata suoraan vain little-endian-koneilla
+MAGIC = b"NHLSNAP1"
+HEADER = struct.Struct("<8sI")
+SECTION = struct.Struct("<QQ")
+ALIGNMENT = 8
+
+SECTIONS = (
+    ("goals", "i"),
+    ("assists", "i"),
+    ("team_codes", "H"),
+    ("nationality_codes", "H"),
+    ("name_offsets", "I"),
+    ("name_table", None),
+    ("teams", None),
+    ("nationalities", None)
+)
+
+
+def _intern(value, lookup):
+    code = lookup.get(value)
+
+    if code is None:
+        code = lookup[value] = len(lookup)
+
+    return code
+
+
+def _string_list(values):
+    return "\n".join(values).encode("utf-8")
+
+
+def write_snapshot(records, path):
+    # records: (nimi, joukkue, kansallisuus, maalit, syötöt), esim. PlayerRecord
+    columns = {
+        "goals": array("i"),
+        "assists": array("i"),
+        "team_codes": array("H"),
+        "nationality_codes": array("H"),
+        "name_offsets": array("I", [0]),
+        "name_table": bytearray()
+    }
+    teams = {}
+    nationalities = {}
+
+    for name, team, nationality, goals, assists in records:
+        columns["goals"].append(goals)
+        columns["assists"].append(assists)
+        columns["team_codes"].append(_intern(team, teams))
+        columns["nationality_codes"].append(_intern(nationality, nationalities))
+        columns["name_table"] += name.encode("utf-8")
+        columns["name_offsets"].append(len(columns["name_table"]))
+
+    columns["teams"] = _string_list(teams)
+    columns["nationalities"] = _string_list(nationalities)
+
+    if sys.byteorder != "little":
+        for name, typecode in SECTIONS:
+            if typecode:
+                columns[name].byteswap()
+
+    sections = [bytes(columns[name]) for name, _ in SECTIONS]
+    offset = HEADER.size + SECTION.size * len(sections)
+    table = []
+
+    for data in sections:
+        offset += -offset % ALIGNMENT
+        table.append((offset, len(data)))
+        offset += len(data)
+
+    # kirjoitetaan erilliseen tiedostoon ja vaihdetaan paikalleen, jotta jo avatut
+    # mmap-näkymät jäävät osoittamaan vanhaan tilannekuvaan
+    temporary = f"{path}.tmp"
+
+    with open(temporary, "wb") as snapshot_file:
+        snapshot_file.write(HEADER.pack(MAGIC, len(columns["goals"])))
+
+        for section_offset, length in table:
+            snapshot_file.write(SECTION.pack(section_offset, length))
+
+        for (section_offset, _), data in zip(table, sections):
+            snapshot_file.write(b"\0" * (section_offset - snapshot_file.tell()))
+            snapshot_file.write(data)
+
+    os.replace(temporary, path)
+
+    return len(columns["goals"])
+
+
+class Snapshot:
+    def __init__(self, path):
+        if sys.byteorder != "little":
+            raise ValueError("snapshots can only be opened on little-endian machines")
+
+        with open(path, "rb") as snapshot_file:
+            self._mmap = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(self._mmap)
+        magic, self._rows = HEADER.unpack_from(view)
+
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a player snapshot")
+
+        self._sections = {}
+
+        for index, (name, typecode) in enumerate(SECTIONS):
+            offset, length = SECTION.unpack_from(view, HEADER.size + index * SECTION.size)
+            section = view[offset:offset + length]
+            self._sections[name] = section.cast(typecode) if typecode else section
+
+        self.goals = self._sections["goals"]
+        self.assists = self._sections["assists"]
+        self.team_codes = self._sections["team_codes"]
+        self.nationality_codes = self._sections["nationality_codes"]
+        self.teams = self.strings("teams")
+        self.nationalities = self.strings("nationalities")
+
+    def __len__(self):
+        return self._rows
+
+    def column(self, name):
+        return self._sections[name]
+
+    def strings(self, name):
+        return str(self._sections[name], "utf-8").split("\n")
+
+    def name(self, row):
+        offsets = self._sections["name_offsets"]
+
+        return str(self._sections["name_table"][offsets[row]:offsets[row + 1]], "utf-8")
+
+    def record(self, row, factory=PlayerRecord):
+        return factory(
+            self.name(row),
+            self.teams[self.team_codes[row]],
+            self.nationalities[self.nationality_codes[row]],
+            self.goals[row],
+            self.assists[row]
+        )
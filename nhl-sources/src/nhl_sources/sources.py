@@ -0,0 +1,85 @@
+import itertools
+import pathlib
+from urllib import request
+
+from nhl_sources.json_stream import parse_json
+from nhl_sources.records import PlayerRecord
+from nhl_sources.snapshot import Snapshot
+from nhl_sources.text import parse_text
+
+CHUNK_SIZE = 64 * 1024
+
+
+def location_url(location):
+    return location if "://" in location else pathlib.Path(location).resolve().as_uri()
+
+
+def parse_any(chunks, factory=PlayerRecord):
+    # muoto päätellään ensimmäisestä merkistä: JSON-taulukko tai puolipisteillä eroteltu teksti
+    chunks = iter(chunks)
+    head = b""
+
+    for chunk in chunks:
+        head += chunk
+
+        if head.strip():
+            break
+
+    parser = parse_json if head.lstrip()[:1] == b"[" else parse_text
+
+    yield from parser(itertools.chain([head], chunks), factory)
+
+
+PARSERS = {"auto": parse_any, "text": parse_text, "json": parse_json}
+
+
+class StreamSource:
+    def __init__(self, location, parser=parse_any, opener=None):
+        self.location = location
+        self._parser = parser
+        self._opener = opener or request.urlopen
+
+    def records(self, factory=PlayerRecord):
+        with self._opener(location_url(self.location)) as stream:
+            yield from self._parser(iter(lambda: stream.read(CHUNK_SIZE), b""), factory)
+
+
+class SnapshotSource:
+    def __init__(self, path):
+        self.location = path
+
+    def snapshot(self):
+        return Snapshot(self.location)
+
+    def records(self, factory=PlayerRecord):
+        snapshot = self.snapshot()
+
+        for row in range(len(snapshot)):
+            yield snapshot.record(row, factory)
+
+
+class SourceReader:
+    # projektin palveluille kelpaava lukija: mikä tahansa lähde ja projektin oma Player-tehdas
+    def __init__(self, source, factory=PlayerRecord):
+        self.source = source
+        self.factory = factory
+
+    def iter_players(self):
+        return self.source.records(self.factory)
+
+    def get_players(self):
+        return list(self.iter_players())
+
+
+def open_source(location, source_format=None, opener=None):
+    if source_format is None:
+        source_format = "snapshot" if str(location).endswith(".snap") else "auto"
+
+    if source_format == "snapshot":
+        return SnapshotSource(location)
+
+    if source_format not in PARSERS:
+        raise ValueError(f"unknown source format {source_format}")
+
+    return StreamSource(location, PARSERS[source_format], opener)
+
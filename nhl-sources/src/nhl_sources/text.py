@@ -0,0 +1,41 @@
+import re
+from nhl_sources.records import PlayerRecord
+
+# nimi;joukkue;kansallisuus;maalit;syötöt[;...] -- muut rivit ohitetaan
+PLAYER_LINE = re.compile(
+    rb"^([^;\n]*);([^;\n]*);([^;\n]*);[ \t]*(-?\d+)[ \t]*;[ \t]*(-?\d+)[ \t\r]*(?:;[^\n]*)?$",
+    re.MULTILINE
+)
+
+
+def parse_text(chunks, factory=PlayerRecord):
+    tail = b""
+    strings = {}
+
+    for chunk in chunks:
+        buffer = tail + chunk if tail else chunk
+        end = buffer.rfind(b"\n") + 1
+
+        yield from parse_buffer(buffer, end, strings, factory)
+
+        tail = buffer[end:]
+
+    if tail:
+        yield from parse_buffer(tail, len(tail), strings, factory)
+
+
+def parse_buffer(buffer, end, strings, factory=PlayerRecord):
+    # joukkueet ja kansallisuudet puretaan kerran ja jaetaan rivien kesken;
+    # purku on kirjoitettu auki, koska tämä silmukka on jäsentimen kuumin kohta
+    for name, team, nationality, goals, assists in PLAYER_LINE.findall(buffer, 0, end):
+        team_name = strings.get(team)
+
+        if team_name is None:
+            team_name = strings[team] = team.strip().decode("utf-8")
+
+        nationality_name = strings.get(nationality)
+
+        if nationality_name is None:
+            nationality_name = strings[nationality] = nationality.strip().decode("utf-8")
+
+        yield factory(name.strip().decode("utf-8"), team_name, nationality_name, int(goals), int(assists))
@@ -0,0 +1,62 @@
+import json
+import unittest
+from nhl_sources.json_stream import JsonArrayStream
+
+PLAYERS = [
+    {"name": "Teemu Selänne", "nationality": "FIN", "team": "ANA", "goals": 40, "assists": 54},
+    {"name": "Saku Koivu", "nationality": "FIN", "team": "MTL", "goals": 20, "assists": 50},
+    {"name": "Jaromír Jágr", "nationality": "CZE", "team": "PIT", "goals": 62, "assists": 87}
+]
+
+def chunks_of(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+class TestJsonArrayStream(unittest.TestCase):
+    def test_whole_array_in_one_chunk(self):
+        data = json.dumps(PLAYERS).encode("utf-8")
+        self.assertEqual(list(JsonArrayStream([data])), PLAYERS)
+
+    def test_every_chunk_size(self):
+        # myös monitavuiset UTF-8-merkit katkeavat palojen väliin
+        data = json.dumps(PLAYERS, ensure_ascii=False, indent=2).encode("utf-8")
+
+        for size in range(1, 40):
+            self.assertEqual(list(JsonArrayStream(chunks_of(data, size))), PLAYERS)
+
+    def test_escapes_and_literals_split_between_chunks(self):
+        values = [{"name": "Jágr 🏒", "active": True, "captain": False, "team": None}] + PLAYERS
+        data = json.dumps(values).encode("utf-8")
+
+        for size in range(1, 20):
+            self.assertEqual(list(JsonArrayStream(chunks_of(data, size))), values)
+
+    def test_malformed_item_fails_before_the_end(self):
+        read = []
+
+        def chunks():
+            for chunk in [b'[{"goals": 1}, {"goals": x}, ', b'{"goals": 2}', b"]"]:
+                read.append(chunk)
+                yield chunk
+
+        with self.assertRaises(ValueError):
+            list(JsonArrayStream(chunks()))
+
+        self.assertEqual(len(read), 1)
+
+    def test_numbers_split_between_chunks(self):
+        self.assertEqual(list(JsonArrayStream([b"[1", b"23, 4", b"5]"])), [123, 45])
+        self.assertEqual(list(JsonArrayStream([b"[1", b"e+3, -2.", b"5]"])), [1000.0, -2.5])
+
+    def test_empty_array(self):
+        self.assertEqual(list(JsonArrayStream([b" [ ", b"]\n"])), [])
+
+    def test_truncated_array(self):
+        with self.assertRaises(ValueError):
+            list(JsonArrayStream([b'[{"name": "Saku"}, {"na']))
+
+    def test_not_an_array(self):
+        with self.assertRaises(ValueError):
+            list(JsonArrayStream([b'{"name": "Saku"}']))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from nhl_sources import ResultCache
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResultCache(2)
+        self.computed = []
+
+    def compute(self, value):
+        def function():
+            self.computed.append(value)
+            return value
+        return function
+
+    def test_repeated_query_is_a_hit(self):
+        self.cache.get("a", 1, self.compute("A"))
+        result = self.cache.get("a", 1, self.compute("A"))
+
+        self.assertEqual(result, "A")
+        self.assertEqual(self.computed, ["A"])
+        self.assertEqual(self.cache.info()[:2], (1, 1))
+        self.assertEqual(self.cache.hit_rate, 0.5)
+
+    def test_new_version_invalidates_entry(self):
+        self.cache.get("a", 1, self.compute("old"))
+        result = self.cache.get("a", 2, self.compute("new"))
+
+        self.assertEqual(result, "new")
+        self.assertEqual(self.cache.misses, 2)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.get("a", 1, self.compute("A"))
+        self.cache.get("b", 1, self.compute("B"))
+        self.cache.get("a", 1, self.compute("A"))
+        self.cache.get("c", 1, self.compute("C"))
+        self.cache.get("a", 1, self.compute("A"))
+        self.cache.get("b", 1, self.compute("B"))
+
+        self.assertEqual(self.computed, ["A", "B", "C", "B"])
+        self.assertEqual(self.cache.evictions, 2)
+        self.assertEqual(self.cache.info().size, 2)
+
+    def test_zero_size_disables_caching(self):
+        cache = ResultCache(0)
+        cache.get("a", 1, self.compute("A"))
+        cache.get("a", 1, self.compute("A"))
+
+        self.assertEqual(self.computed, ["A", "A"])
+        self.assertEqual(len(cache), 0)
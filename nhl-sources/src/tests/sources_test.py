@@ -0,0 +1,100 @@
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+from nhl_sources import PlayerRecord, Snapshot, SnapshotSource, SourceReader, StreamSource, open_source, write_snapshot
+
+RECORDS = [
+    PlayerRecord("Semenko", "EDM", "CAN", 4, 12),
+    PlayerRecord("Kurri", "EDM", "FIN", 37, 53),
+    PlayerRecord("Selänne", "ANA", "FIN", 40, 54)
+]
+
+MINIMUM_RECORDS_PER_SECOND = 20_000
+
+class TestSources(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, data):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "wb") as output:
+            output.write(data)
+        return path
+
+    def text_file(self):
+        lines = "".join(f"{r.name};{r.team};{r.nationality};{r.goals};{r.assists};0\n" for r in RECORDS)
+        return self.write("players.txt", lines.encode("utf-8"))
+
+    def json_file(self, records=RECORDS):
+        return self.write("players", json.dumps([record._asdict() for record in records]).encode("utf-8"))
+
+    def test_text_file_is_detected(self):
+        self.assertEqual(list(open_source(self.text_file()).records()), RECORDS)
+
+    def test_source_reader_uses_factory(self):
+        reader = SourceReader(open_source(self.text_file()), lambda name, *fields: name)
+
+        self.assertEqual(reader.get_players(), [record.name for record in RECORDS])
+        self.assertEqual(next(reader.iter_players()), RECORDS[0].name)
+
+    def test_json_without_suffix_is_detected(self):
+        self.assertEqual(list(open_source(self.json_file()).records()), RECORDS)
+
+    def test_explicit_format(self):
+        source = open_source(self.text_file(), source_format="text")
+
+        self.assertIsInstance(source, StreamSource)
+        self.assertEqual(len(list(source.records())), 3)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            open_source("players.xml", source_format="xml")
+
+    def test_snapshot_round_trip(self):
+        path = os.path.join(self.directory.name, "players.snap")
+        self.assertEqual(write_snapshot(open_source(self.text_file()).records(), path), 3)
+
+        source = open_source(path)
+
+        self.assertIsInstance(source, SnapshotSource)
+        self.assertEqual(list(source.records()), RECORDS)
+        self.assertEqual(source.snapshot().teams, ["EDM", "ANA"])
+
+    def test_not_a_snapshot(self):
+        with self.assertRaises(ValueError):
+            Snapshot(self.write("players.snap", b"Semenko;EDM;CAN;4;12\n" * 10))
+
+    def test_opener_replaces_urlopen(self):
+        opened = []
+
+        def opener(url):
+            opened.append(url)
+            return io.BytesIO(b"Kurri;EDM;FIN;37;53\n")
+
+        records = list(open_source("https://example.com/players.txt", opener=opener).records())
+
+        self.assertEqual(opened, ["https://example.com/players.txt"])
+        self.assertEqual(records, [RECORDS[1]])
+
+    def test_empty_file(self):
+        self.assertEqual(list(open_source(self.write("empty.txt", b"")).records()), [])
+
+    def test_json_throughput(self):
+        records = [PlayerRecord(f"Player {i}", "EDM", "FIN", i % 50, i % 70) for i in range(20_000)]
+        source = open_source(self.json_file(records))
+
+        start = time.perf_counter()
+        count = sum(1 for _ in source.records())
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(count, 20_000)
+        self.assertGreater(count / elapsed, MINIMUM_RECORDS_PER_SECOND)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import time
+import unittest
+from nhl_sources import PlayerRecord, parse_text
+
+PLAYERS_TXT = (
+    b"Semenko;EDM;CAN;4;12;0\n"
+    b"Lemieux; PIT ;CAN; 45 ;54\n"
+    b"broken line\n"
+    b"Kurri;EDM;FIN;x;53\n"
+    b"Yzerman;DET;CAN;42\n"
+    b"\n"
+    b"Gretzky;EDM;CAN;35;89"
+)
+
+# hidas kone tai CI ei saa kaataa testiä, mutta kertaluokan hidastus huomataan
+MINIMUM_LINES_PER_SECOND = 50_000
+
+class TestParseText(unittest.TestCase):
+    def test_records(self):
+        self.assertEqual(list(parse_text([PLAYERS_TXT])), [
+            PlayerRecord("Semenko", "EDM", "CAN", 4, 12),
+            PlayerRecord("Lemieux", "PIT", "CAN", 45, 54),
+            PlayerRecord("Gretzky", "EDM", "CAN", 35, 89)
+        ])
+
+    def test_lines_split_across_chunks(self):
+        for size in range(1, 20):
+            chunks = [PLAYERS_TXT[i:i + size] for i in range(0, len(PLAYERS_TXT), size)]
+            names = [record.name for record in parse_text(chunks)]
+            self.assertEqual(names, ["Semenko", "Lemieux", "Gretzky"])
+
+    def test_repeated_strings_are_shared(self):
+        records = list(parse_text([PLAYERS_TXT]))
+
+        self.assertIs(records[0].team, records[2].team)
+        self.assertIs(records[0].nationality, records[1].nationality)
+
+    def test_factory_builds_rows_directly(self):
+        rows = list(parse_text([PLAYERS_TXT], lambda name, team, nationality, goals, assists: (name, goals)))
+
+        self.assertEqual(rows, [("Semenko", 4), ("Lemieux", 45), ("Gretzky", 35)])
+
+    def test_throughput(self):
+        data = b"".join(b"Player Number%d;EDM;FIN;%d;%d;0\n" % (i, i % 50, i % 70) for i in range(100_000))
+        chunks = [data[i:i + 65536] for i in range(0, len(data), 65536)]
+
+        best = None
+        for _ in range(3):
+            start = time.perf_counter()
+            count = sum(1 for _ in parse_text(chunks))
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        self.assertEqual(count, 100_000)
+        self.assertGreater(count / best, MINIMUM_LINES_PER_SECOND)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import heapq
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class GroupStats:
+    def __init__(self, key, count=0, goals=0, assists=0):
+        self.key = key
+        self.count = count
+        self.goals = goals
+        self.assists = assists
+        self.top = []
+
+    @property
+    def points(self):
+        return self.goals + self.assists
+
+    def _average(self, total):
+        if self.count == 0:
+            return 0.0
+        return total / self.count
+
+    @property
+    def average_goals(self):
+        return self._average(self.goals)
+
+    @property
+    def average_assists(self):
+        return self._average(self.assists)
+
+    @property
+    def average_points(self):
+        return self._average(self.points)
+
+    def __str__(self):
+        return f"{self.key}: {self.count} players, {self.goals} + {self.assists} = {self.points}"
+
+
+def aggregate_rows(rows, keys, goals, assists, values, top):
+    groups = {}
+    heaps = {}
+
+    for row in rows:
+        key = keys[row]
+        group = groups.get(key)
+
+        if group is None:
+            group = groups[key] = GroupStats(key)
+            heaps[key] = []
+
+        group.count += 1
+        group.goals += goals[row]
+        group.assists += assists[row]
+
+        if top:
+            # keon pienin alkio on heikoin; tasapelissä aiempi rivi voittaa
+            entry = (values[row], -row)
+            heap = heaps[key]
+
+            if len(heap) < top:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+    for key, group in groups.items():
+        group.top = [-row for _, row in sorted(heaps[key], reverse=True)]
+
+    return groups
+
+
+def aggregate_codes(codes, labels, goals, assists, values, top, mask=None):
+    codes = numpy.frombuffer(codes, dtype=numpy.uint16)
+    goals = numpy.frombuffer(goals, dtype=numpy.int32)
+    assists = numpy.frombuffer(assists, dtype=numpy.int32)
+    values = numpy.frombuffer(values, dtype=numpy.int32)
+    rows = numpy.arange(len(codes))
+
+    if mask is not None:
+        codes, goals, assists, values, rows = codes[mask], goals[mask], assists[mask], values[mask], rows[mask]
+
+    size = len(labels)
+    counts = numpy.bincount(codes, minlength=size)
+    goal_sums = numpy.bincount(codes, weights=goals, minlength=size)
+    assist_sums = numpy.bincount(codes, weights=assists, minlength=size)
+
+    # ryhmät ensiesiintymisjärjestyksessä kuten Python-toteutuksessa
+    _, first_rows = numpy.unique(codes, return_index=True)
+    present = numpy.unique(codes)[numpy.argsort(first_rows)]
+
+    groups = {}
+
+    for code in present.tolist():
+        groups[labels[code]] = GroupStats(
+            labels[code],
+            int(counts[code]),
+            int(goal_sums[code]),
+            int(assist_sums[code])
+        )
+
+    if top:
+        order = numpy.lexsort((rows, -values.astype(numpy.int64), codes))
+        starts = numpy.concatenate(([0], numpy.cumsum(counts)[:-1]))
+
+        for code in present.tolist():
+            start = starts[code]
+            groups[labels[code]].top = rows[order[start:start + min(top, counts[code])]].tolist()
+
+    return groups
@@ -0,0 +1,158 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from nhl_sources import open_source, write_snapshot
+from player_reader import PlayerReader
+from snapshot import SnapshotReader
+from statistics_service import StatisticsService, SortBy
+from synthetic import TEAMS, InMemoryReader, players_txt, synthetic_players
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+STORES = {"objects": False, "columnar": True}
+
+
+def measure(function, repeat=5, setup=None):
+    best = None
+
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best * 1000
+
+
+def benchmark_loading(players, directory):
+    text_path = os.path.join(directory, "players.txt")
+    snapshot_path = os.path.join(directory, "players.snap")
+
+    with open(text_path, "wb") as text_file:
+        text_file.write(players_txt(players))
+
+    # sama muunnos kuin python -m nhl_sources players.txt players.snap
+    write_snapshot(open_source(text_path).records(), snapshot_path)
+
+    text_reader = PlayerReader("file://" + text_path)
+    snapshot_reader = SnapshotReader(snapshot_path)
+
+    return {
+        "parse_ms": measure(text_reader.get_players, repeat=3),
+        "startup_text_ms": measure(lambda: StatisticsService(text_reader, columnar=True), repeat=3),
+        "startup_snapshot_ms": measure(lambda: StatisticsService(snapshot_reader), repeat=3)
+    }
+
+
+def benchmark_queries(players, columnar):
+    reader = InMemoryReader(players)
+
+    tracemalloc.start()
+    stats = StatisticsService(reader, columnar=columnar)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if not columnar:
+        # listamallissa pelaajaoliot kuuluvat tallennusmuotoon
+        memory += sum(map(sys.getsizeof, players))
+
+    results = {
+        "memory_mb": memory / 1024 / 1024,
+        "load_ms": measure(lambda: StatisticsService(reader, columnar=columnar), repeat=3),
+        "search_index_ms": measure(lambda: stats.search("x"), setup=stats.reload, repeat=3),
+        "search_ms": measure(lambda: stats.search_all("berson", ignore_case=True, limit=20)),
+        "search_miss_ms": measure(lambda: stats.search("Nobody")),
+        "team_ms": measure(lambda: [stats.team(team) for team in TEAMS]),
+        "aggregate_ms": measure(lambda: stats.aggregate("team", top=5), repeat=3),
+        "aggregate_python_ms": measure(lambda: stats.aggregate("team", top=5, vectorized=False), repeat=3)
+    }
+
+    for sort_by in SortBy:
+        name = sort_by.name.lower()
+        results[f"top_{name}_first_ms"] = measure(lambda: stats.top(10, sort_by), setup=stats.reload)
+        results[f"top_{name}_ms"] = measure(lambda: stats.top(10, sort_by))
+
+    return results
+
+
+def run(sizes, seed):
+    results = {}
+
+    for size in sizes:
+        players = synthetic_players(size, seed)
+
+        with tempfile.TemporaryDirectory() as directory:
+            for case, value in benchmark_loading(players, directory).items():
+                results[f"{size}/{case}"] = value
+
+        for store, columnar in STORES.items():
+            for case, value in benchmark_queries(players, columnar).items():
+                results[f"{size}/{store}/{case}"] = value
+
+    return results
+
+
+def compare(results, baseline, threshold, min_ms=0.1):
+    # kaikki mittarit ovat "pienempi on parempi"; hyvin pienet ajat ovat pelkkää kohinaa
+    regressions = []
+
+    for case, value in results.items():
+        previous = baseline.get(case)
+
+        if previous is None or previous < min_ms:
+            continue
+
+        if value > previous * (1 + threshold):
+            regressions.append((case, previous, value))
+
+    return regressions
+
+
+def parse_arguments(arguments):
+    parser = argparse.ArgumentParser(description="Benchmark nhl-statistics hot paths on synthetic rosters")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="baseline JSON file written earlier with --output")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown, 0.2 = 20 %%")
+
+    return parser.parse_args(arguments)
+
+
+def main(arguments=None):
+    options = parse_arguments(arguments)
+    results = run(options.sizes, options.seed)
+
+    for case, value in results.items():
+        print(f"{case:45} {value:12.3f}")
+
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as output_file:
+            json.dump({
+                "python": platform.python_version(),
+                "seed": options.seed,
+                "results": results
+            }, output_file, indent=2)
+
+    if options.compare:
+        with open(options.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+
+        regressions = compare(results, baseline, options.threshold)
+
+        for case, previous, value in regressions:
+            print(f"REGRESSION {case}: {previous:.3f} -> {value:.3f}")
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
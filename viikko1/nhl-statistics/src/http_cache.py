@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from urllib import request
+from urllib.error import HTTPError
+
+
+class HttpCache:
+    def __init__(self, directory, max_age=300, stale_while_revalidate=False):
+        self._directory = directory
+        self._max_age = max_age
+        self._stale_while_revalidate = stale_while_revalidate
+        self._refreshing = {}
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self._directory, key)
+
+        return base + ".body", base + ".json"
+
+    def _read_meta(self, url):
+        body_path, meta_path = self._paths(url)
+
+        if not os.path.exists(body_path) or not os.path.exists(meta_path):
+            return None
+
+        with open(meta_path, encoding="utf-8") as meta_file:
+            return json.load(meta_file)
+
+    def _write_meta(self, url, meta):
+        _, meta_path = self._paths(url)
+        handle, temp_path = tempfile.mkstemp(dir=self._directory)
+
+        with os.fdopen(handle, "w", encoding="utf-8") as meta_file:
+            json.dump(meta, meta_file)
+
+        os.replace(temp_path, meta_path)
+
+    def _store(self, url, response):
+        body_path, _ = self._paths(url)
+        handle, temp_path = tempfile.mkstemp(dir=self._directory)
+
+        # kirjoitetaan ensin väliaikaiseen tiedostoon, ettei lukija näe puolikasta
+        with os.fdopen(handle, "wb") as body_file:
+            shutil.copyfileobj(response, body_file)
+
+        os.replace(temp_path, body_path)
+        self._write_meta(url, {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time()
+        })
+
+    def revalidate(self, url):
+        meta = self._read_meta(url)
+        headers = {}
+
+        if meta is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            with request.urlopen(request.Request(url, headers=headers)) as response:
+                self._store(url, response)
+        except HTTPError as error:
+            if error.code != 304 or meta is None:
+                raise
+
+            meta["fetched_at"] = time.time()
+            self._write_meta(url, meta)
+
+    def _revalidate_in_background(self, url):
+        with self._lock:
+            if url in self._refreshing:
+                return
+
+            thread = threading.Thread(target=self._background_refresh, args=(url,), daemon=True)
+            self._refreshing[url] = thread
+
+        thread.start()
+
+    def _background_refresh(self, url):
+        try:
+            self.revalidate(url)
+        except OSError:
+            # vanhentunut kopio jää käyttöön, seuraava haku yrittää uudelleen
+            pass
+        finally:
+            with self._lock:
+                del self._refreshing[url]
+
+    def wait(self):
+        with self._lock:
+            threads = list(self._refreshing.values())
+
+        for thread in threads:
+            thread.join()
+
+    def open(self, url):
+        meta = self._read_meta(url)
+
+        if meta is None:
+            self.revalidate(url)
+        elif time.time() - meta["fetched_at"] > self._max_age:
+            if self._stale_while_revalidate:
+                self._revalidate_in_background(url)
+            else:
+                self.revalidate(url)
+
+        body_path, _ = self._paths(url)
+
+        return open(body_path, "rb")
@@ -0,0 +1,58 @@
+from array import array
+
+GRAM_LENGTH = 3
+EMPTY = array("I")
+
+
+def grams(text):
+    return {text[i:i + GRAM_LENGTH] for i in range(len(text) - GRAM_LENGTH + 1)}
+
+
+class NameIndex:
+    def __init__(self, names):
+        self._names = names
+        self._postings = {}
+
+        for row, name in enumerate(names):
+            self.add(row, name)
+
+    def add(self, row, name):
+        # rivit lisätään kasvavassa järjestyksessä, joten listat pysyvät järjestettyinä
+        for gram in grams(name.casefold()):
+            postings = self._postings.get(gram)
+
+            if postings is None:
+                postings = self._postings[gram] = array("I")
+
+            postings.append(row)
+
+    def _candidates(self, query):
+        query_grams = grams(query.casefold())
+
+        if not query_grams:
+            return range(len(self._names))
+
+        return min(
+            (self._postings.get(gram, EMPTY) for gram in query_grams),
+            key=len
+        )
+
+    def find(self, query, prefix=False, ignore_case=False, limit=None):
+        if ignore_case:
+            query = query.casefold()
+
+        rows = []
+
+        for row in self._candidates(query):
+            if limit is not None and len(rows) >= limit:
+                break
+
+            name = self._names[row]
+
+            if ignore_case:
+                name = name.casefold()
+
+            if name.startswith(query) if prefix else query in name:
+                rows.append(row)
+
+        return rows
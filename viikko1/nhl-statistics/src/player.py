@@ -1,13 +1,15 @@
 class Player:
-    def __init__(self, name, team, goals, assists):
+    # kiinteät kentät ilman oliokohtaista __dict__:iä, pisteet lasketaan kerran
+    __slots__ = ("name", "team", "goals", "assists", "points", "season", "nationality")
+
+    def __init__(self, name, team, goals, assists, season=None, nationality=None):
         self.name = name
         self.team = team
         self.goals = goals
         self.assists = assists
-
-    @property
-    def points(self):
-        return self.goals + self.assists
+        self.points = goals + assists
+        self.season = season
+        self.nationality = nationality
 
     def __str__(self):
         return f"{self.name} {self.team} {self.goals} + {self.assists} = {self.points}"
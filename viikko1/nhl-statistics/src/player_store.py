@@ -0,0 +1,188 @@
+from array import array
+from operator import add
+from player import Player
+
+
+def group_rows(values):
+    groups = {}
+
+    for row, value in enumerate(values):
+        groups.setdefault(value, []).append(row)
+
+    return groups
+
+
+class ListPlayerStore:
+    def __init__(self, players):
+        self._players = list(players)
+        self._columns = {}
+
+    def __len__(self):
+        return len(self._players)
+
+    def player(self, row):
+        return self._players[row]
+
+    def column(self, name):
+        if name not in self._columns:
+            self._columns[name] = [getattr(player, name) for player in self._players]
+
+        return self._columns[name]
+
+    def group_rows(self, name):
+        return group_rows(self.column(name))
+
+    def append(self, player):
+        self._players.append(player)
+
+        for name, values in self._columns.items():
+            values.append(getattr(player, name))
+
+    def update(self, row, player):
+        self._players[row] = player
+
+        for name, values in self._columns.items():
+            values[row] = getattr(player, name)
+
+
+class InternedColumn:
+    def __init__(self, codes=None, values=()):
+        self.codes = array("H") if codes is None else codes
+        self.values = list(values)
+        self._lookup = {value: code for code, value in enumerate(self.values)}
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, row):
+        return self.values[self.codes[row]]
+
+    def _code(self, value):
+        code = self._lookup.get(value)
+
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._lookup[value] = code
+
+        return code
+
+    def append(self, value):
+        self.codes.append(self._code(value))
+
+    def __setitem__(self, row, value):
+        self.codes[row] = self._code(value)
+
+    def group_rows(self):
+        groups_by_code = [[] for _ in self.values]
+
+        for row, code in enumerate(self.codes):
+            groups_by_code[code].append(row)
+
+        return dict(zip(self.values, groups_by_code))
+
+
+class StringTableColumn:
+    def __init__(self, table, offsets):
+        self._table = table
+        self._offsets = offsets
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, row):
+        start = self._offsets[row]
+        end = self._offsets[row + 1]
+
+        return str(self._table[start:end], "utf-8")
+
+
+class ColumnarPlayerStore:
+    INTERNED = ("team", "season", "nationality")
+
+    def __init__(self, players=()):
+        self._goals = array("i")
+        self._assists = array("i")
+        self._interned = {name: InternedColumn() for name in self.INTERNED}
+        self._name_table = bytearray()
+        self._name_offsets = array("I", [0])
+        self._points = None
+
+        for player in players:
+            self.append(player)
+
+    @classmethod
+    def from_columns(cls, goals, assists, name_table, name_offsets, interned):
+        # sarakkeet voivat olla myös vain luettavia näkymiä, esim. mmap-tilannekuvaan
+        store = cls()
+        store._goals = goals
+        store._assists = assists
+        store._name_table = name_table
+        store._name_offsets = name_offsets
+
+        for name in cls.INTERNED:
+            # puuttuva sarake tulkitaan arvoksi None kaikilla riveillä
+            missing = InternedColumn(array("H", bytes(2 * len(goals))), [None])
+            store._interned[name] = interned.get(name, missing)
+
+        return store
+
+    def __len__(self):
+        return len(self._goals)
+
+    def append(self, player):
+        self._goals.append(player.goals)
+        self._assists.append(player.assists)
+        self._interned["team"].append(player.team)
+        self._interned["season"].append(player.season)
+        self._interned["nationality"].append(player.nationality)
+        self._name_table += player.name.encode("utf-8")
+        self._name_offsets.append(len(self._name_table))
+
+        if self._points is not None:
+            self._points.append(player.goals + player.assists)
+
+    def update(self, row, player):
+        # nimi ja kausi tunnistavat pelaajan, joten niitä ei päivitetä
+        self._goals[row] = player.goals
+        self._assists[row] = player.assists
+        self._interned["team"][row] = player.team
+        self._interned["nationality"][row] = player.nationality
+
+        if self._points is not None:
+            self._points[row] = player.goals + player.assists
+
+    def player(self, row):
+        start = self._name_offsets[row]
+        end = self._name_offsets[row + 1]
+
+        return Player(
+            str(self._name_table[start:end], "utf-8"),
+            self._interned["team"][row],
+            self._goals[row],
+            self._assists[row],
+            self._interned["season"][row],
+            self._interned["nationality"][row]
+        )
+
+    def group_rows(self, name):
+        if name in self._interned:
+            return self._interned[name].group_rows()
+
+        return group_rows(self.column(name))
+
+    def column(self, name):
+        if name == "goals":
+            return self._goals
+        if name == "assists":
+            return self._assists
+        if name == "points":
+            if self._points is None:
+                self._points = array("i", map(add, self._goals, self._assists))
+            return self._points
+        if name in self._interned:
+            return self._interned[name]
+        if name == "name":
+            return StringTableColumn(self._name_table, self._name_offsets)
+
+        raise KeyError(name)
@@ -0,0 +1,41 @@
+from concurrent.futures import ThreadPoolExecutor
+from player_reader import PlayerReader
+
+SEASON_URL = "https://studies.cs.helsinki.fi/nhlstats/{season}/players.txt"
+
+
+class MultiSeasonReader:
+    def __init__(self, seasons, url_template=SEASON_URL, max_workers=4, reader_factory=PlayerReader):
+        self._seasons = list(seasons)
+        self._url_template = url_template
+        self._max_workers = max_workers
+        self._reader_factory = reader_factory
+        self.failures = {}
+
+    def _read_season(self, season):
+        reader = self._reader_factory(self._url_template.format(season=season))
+        players = reader.get_players()
+
+        for player in players:
+            player.season = season
+
+        return players
+
+    def get_players(self):
+        self.failures = {}
+        players = []
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = [
+                (season, executor.submit(self._read_season, season))
+                for season in self._seasons
+            ]
+
+            # yhden kauden virhe kirjataan, muiden kausien pelaajat ladataan silti
+            for season, future in futures:
+                try:
+                    players.extend(future.result())
+                except (OSError, ValueError) as error:
+                    self.failures[season] = error
+
+        return players
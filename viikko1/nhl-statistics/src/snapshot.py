@@ -0,0 +1,31 @@
+from nhl_sources import Snapshot
+from player_store import ColumnarPlayerStore, InternedColumn
+
+
+class SnapshotReader:
+    def __init__(self, path):
+        self._path = path
+
+    def store(self):
+        snapshot = Snapshot(self._path)
+
+        return ColumnarPlayerStore.from_columns(
+            snapshot.column("goals"),
+            snapshot.column("assists"),
+            snapshot.column("name_table"),
+            snapshot.column("name_offsets"),
+            {
+                "team": InternedColumn(snapshot.column("team_codes"), snapshot.teams),
+                "nationality": InternedColumn(snapshot.column("nationality_codes"), snapshot.nationalities)
+            }
+        )
+
+    def iter_players(self):
+        store = self.store()
+
+        for row in range(len(store)):
+            yield store.player(row)
+
+    def get_players(self):
+        return list(self.iter_players())
+
@@ -1,4 +1,10 @@
+import heapq
+from bisect import bisect_left, insort
+from collections import namedtuple
 from player_reader import PlayerReader
+from player_store import ListPlayerStore, ColumnarPlayerStore, InternedColumn, group_rows
+from aggregate import aggregate_rows, aggregate_codes, numpy
+from name_index import NameIndex
 from enum import Enum
 
 class SortBy(Enum):
@@ -6,45 +12,279 @@ class SortBy(Enum):
     GOALS = 2
     ASSISTS = 3
 
+SORT_COLUMNS = {
+    SortBy.POINTS: "points",
+    SortBy.GOALS: "goals",
+    SortBy.ASSISTS: "assists"
+}
+
+RefreshResult = namedtuple("RefreshResult", ["changed", "added", "removed"])
+
+# ensimmäinen top-haku tehdään keolla, jos pyydetään enintään 1/16 pelaajista
+PARTIAL_SELECTION_RATIO = 16
+
 class StatisticsService:
-    def __init__(self, player_reader : PlayerReader):
+    def __init__(self, player_reader : PlayerReader, columnar=False):
         self.reader = player_reader
+        self._columnar = columnar
 
-        self._players = self.reader.get_players()
+        self.reload()
 
-    def search(self, name):
-        for player in self._players:
-            if name in player.name:
-                return player
-        return None
-
-    def team(self, team_name):
-        players_of_team = filter(
-            lambda player: player.team == team_name,
-            self._players
-        )
+    def reload(self):
+        open_store = getattr(self.reader, "store", None)
+
+        if open_store is None:
+            self._store = self._create_store(self._read_players())
+        else:
+            self._store = open_store()
+
+        self._reset_caches()
+
+    def _reset_caches(self):
+        self._rankings = {}
+        self._requested_rankings = set()
+        self._indexes = {}
+        self._name_index = None
+        self._row_ids = None
+
+    def _read_players(self):
+        # virtaava luku antaa sarakemallin täyttyä latauksen edetessä
+        iter_players = getattr(self.reader, "iter_players", None)
 
-        return list(players_of_team)
-
-    def top(self, how_many, sort_by=SortBy.POINTS):
-        key = None
-        if sort_by == SortBy.POINTS:
-            key = lambda player: player.points
-        elif sort_by == SortBy.GOALS:
-            key = lambda player: player.goals
-        elif sort_by == SortBy.ASSISTS:
-            key = lambda player: player.assists
-
-        sorted_players = sorted(
-            self._players,
-            reverse=True,
-            key=key
+        if iter_players is None:
+            return self.reader.get_players()
+        return iter_players()
+
+    def _create_store(self, players):
+        if self._columnar:
+            return ColumnarPlayerStore(players)
+
+        return ListPlayerStore(players)
+
+    def _players(self, rows):
+        return [self._store.player(row) for row in rows]
+
+    def search_all(self, name, prefix=False, ignore_case=False, limit=None):
+        if self._name_index is None:
+            self._name_index = NameIndex(self._store.column("name"))
+
+        rows = self._name_index.find(
+            name,
+            prefix=prefix,
+            ignore_case=ignore_case,
+            limit=limit
         )
-        
-        result = []
-        i = 0
-        while i <= how_many - 1:
-            result.append(sorted_players[i])
-            i += 1
-
-        return result
\ No newline at end of file
+
+        return self._players(rows)
+
+    def search(self, name):
+        players = self.search_all(name, limit=1)
+
+        if not players:
+            return None
+        return players[0]
+
+    def _index(self, fields):
+        if fields not in self._indexes:
+            if len(fields) == 1:
+                self._indexes[fields] = self._store.group_rows(fields[0])
+            else:
+                columns = [self._store.column(field) for field in fields]
+                self._indexes[fields] = group_rows(zip(*columns))
+
+        return self._indexes[fields]
+
+    def _rows(self, season):
+        if season is None:
+            return range(len(self._store))
+
+        return self._index(("season",)).get(season, [])
+
+    def seasons(self):
+        return [season for season in self._index(("season",)) if season is not None]
+
+    def players_by(self, field, value, season=None):
+        if season is None:
+            rows = self._index((field,)).get(value, [])
+        else:
+            rows = self._index((field, "season")).get((value, season), [])
+
+        return self._players(rows)
+
+    def team(self, team_name, season=None):
+        return self.players_by("team", team_name, season)
+
+    def _ranking(self, sort_by, season):
+        key = (sort_by, season)
+
+        if key not in self._rankings:
+            values = self._store.column(SORT_COLUMNS[sort_by])
+
+            self._rankings[key] = sorted(
+                self._rows(season),
+                reverse=True,
+                key=values.__getitem__
+            )
+
+        return self._rankings[key]
+
+    def top(self, how_many, sort_by=SortBy.POINTS, season=None):
+        key = (sort_by, season)
+        rows = self._rows(season)
+        how_many = max(how_many, 0)
+        small = how_many * PARTIAL_SELECTION_RATIO <= len(rows)
+        first = key not in self._rankings and key not in self._requested_rankings
+
+        if small and first:
+            # toistuvat haut käyttävät valmiiksi järjestettyä listaa
+            self._requested_rankings.add(key)
+            values = self._store.column(SORT_COLUMNS[sort_by])
+
+            return self._players(heapq.nlargest(
+                how_many,
+                rows,
+                key=values.__getitem__
+            ))
+
+        return self._players(self._ranking(sort_by, season)[:how_many])
+
+    def _season_mask(self, season):
+        seasons = self._store.column("season")
+        code = seasons.values.index(season) if season in seasons.values else -1
+
+        return numpy.frombuffer(seasons.codes, dtype=numpy.uint16) == code
+
+    def aggregate(self, group_by="team", top=0, sort_by=SortBy.POINTS, season=None, vectorized=True):
+        keys = self._store.column(group_by)
+        goals = self._store.column("goals")
+        assists = self._store.column("assists")
+        values = self._store.column(SORT_COLUMNS[sort_by])
+
+        if vectorized and numpy is not None and isinstance(keys, InternedColumn):
+            mask = None if season is None else self._season_mask(season)
+            groups = aggregate_codes(keys.codes, keys.values, goals, assists, values, top, mask)
+        else:
+            groups = aggregate_rows(self._rows(season), keys, goals, assists, values, top)
+
+        for group in groups.values():
+            group.top = self._players(group.top)
+
+        return groups
+
+    def _identities(self, seasons, names):
+        # samannimiset pelaajat erotetaan järjestysnumerolla
+        occurrences = {}
+
+        for season, name in zip(seasons, names):
+            key = (season, name)
+            occurrence = occurrences.get(key, 0)
+            occurrences[key] = occurrence + 1
+
+            yield season, name, occurrence
+
+    def _identity_rows(self):
+        if self._row_ids is None:
+            identities = self._identities(self._store.column("season"), self._store.column("name"))
+            self._row_ids = {identity: row for row, identity in enumerate(identities)}
+
+        return self._row_ids
+
+    def _unindex(self, row):
+        for fields, index in self._indexes.items():
+            key = tuple(self._store.column(field)[row] for field in fields)
+            rows = index[key if len(fields) > 1 else key[0]]
+            del rows[bisect_left(rows, row)]
+
+        for (sort_by, season), ranking in self._rankings.items():
+            if season is None or season == self._store.column("season")[row]:
+                values = self._store.column(SORT_COLUMNS[sort_by])
+                del ranking[bisect_left(ranking, (-values[row], row), key=lambda r: (-values[r], r))]
+
+    def _index_row(self, row):
+        for fields, index in self._indexes.items():
+            key = tuple(self._store.column(field)[row] for field in fields)
+            insort(index.setdefault(key if len(fields) > 1 else key[0], []), row)
+
+        for (sort_by, season), ranking in self._rankings.items():
+            if season is None or season == self._store.column("season")[row]:
+                values = self._store.column(SORT_COLUMNS[sort_by])
+                insort(ranking, row, key=lambda r: (-values[r], r))
+
+    def _diff(self, seasons, names, teams, nationalities, goals, assists):
+        # uudet rivit verrataan tunnisteen perusteella nykyisiin riveihin
+        row_ids = self._identity_rows()
+        old_teams = self._store.column("team")
+        old_nationalities = self._store.column("nationality")
+        old_goals = self._store.column("goals")
+        old_assists = self._store.column("assists")
+        changed = []
+        added = []
+        reordered = False
+
+        for position, identity in enumerate(self._identities(seasons, names)):
+            row = row_ids.get(identity)
+
+            if row is None:
+                added.append((identity, position))
+            elif (
+                old_goals[row] != goals[position]
+                or old_assists[row] != assists[position]
+                or old_teams[row] != teams[position]
+                or old_nationalities[row] != nationalities[position]
+            ):
+                changed.append((row, position))
+
+            # uudelleenlatauksessa rivit olisivat lähteen järjestyksessä ja uudet niiden perässä
+            reordered = reordered or row != (position if position < len(row_ids) else None)
+
+        removed = len(row_ids) - (len(names) - len(added))
+
+        return changed, added, removed, reordered
+
+    def _refresh_store(self, open_store):
+        # tilannekuva on vain luettava, joten se avataan uudelleen ja sarakkeita verrataan vanhoihin
+        store = open_store()
+        changed, added, removed, _ = self._diff(*(
+            store.column(name) for name in ("season", "name", "team", "nationality", "goals", "assists")
+        ))
+
+        self._store = store
+        self._reset_caches()
+
+        return RefreshResult(len(changed), len(added), removed)
+
+    def refresh(self):
+        open_store = getattr(self.reader, "store", None)
+
+        if open_store is not None:
+            return self._refresh_store(open_store)
+
+        players = list(self._read_players())
+        changed, added, removed, reordered = self._diff(*(
+            [getattr(player, name) for player in players]
+            for name in ("season", "name", "team", "nationality", "goals", "assists")
+        ))
+
+        if removed or reordered:
+            # rivien poistaminen tai siirtäminen muuttaisi rivinumeroita, joten rakennetaan kaikki uudelleen
+            self._store = self._create_store(players)
+            self._reset_caches()
+            return RefreshResult(len(changed), len(added), removed)
+
+        for row, position in changed:
+            self._unindex(row)
+            self._store.update(row, players[position])
+            self._index_row(row)
+
+        row_ids = self._identity_rows()
+
+        for identity, position in added:
+            row = len(self._store)
+            self._store.append(players[position])
+            row_ids[identity] = row
+            self._index_row(row)
+
+            if self._name_index is not None:
+                self._name_index.add(row, players[position].name)
+
+        return RefreshResult(len(changed), len(added), 0)
@@ -0,0 +1,52 @@
+import random
+from player import Player
+
+TEAMS = [
+    "ANA", "BOS", "BUF", "CAR", "CBJ", "CGY", "CHI", "COL", "DAL", "DET", "EDM",
+    "FLA", "LAK", "MIN", "MTL", "NJD", "NSH", "NYI", "NYR", "OTT", "PHI", "PIT",
+    "SEA", "SJS", "STL", "TBL", "TOR", "UTA", "VAN", "VGK", "WPG", "WSH"
+]
+
+SYLLABLES = [
+    "ka", "ri", "mo", "le", "sa", "tu", "ne", "vi", "ko", "la", "mi", "ro",
+    "da", "ber", "son", "sky", "ov", "en", "ma", "ty", "an", "el", "is", "ju"
+]
+
+
+def synthetic_name(generator):
+    first = "".join(generator.choice(SYLLABLES) for _ in range(generator.randint(2, 3)))
+    last = "".join(generator.choice(SYLLABLES) for _ in range(generator.randint(2, 4)))
+
+    return f"{first.capitalize()} {last.capitalize()}"
+
+
+def synthetic_players(size, seed=2024):
+    # sama siemen tuottaa aina saman kokoonpanon
+    generator = random.Random(seed)
+
+    return [
+        Player(
+            synthetic_name(generator),
+            generator.choice(TEAMS),
+            generator.randrange(60),
+            generator.randrange(90)
+        )
+        for _ in range(size)
+    ]
+
+
+def players_txt(players):
+    lines = (
+        f"{player.name};{player.team};FIN;{player.goals};{player.assists};0\n"
+        for player in players
+    )
+
+    return "".join(lines).encode("utf-8")
+
+
+class InMemoryReader:
+    def __init__(self, players):
+        self._players = players
+
+    def get_players(self):
+        return list(self._players)
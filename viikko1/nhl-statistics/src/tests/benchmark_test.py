@@ -0,0 +1,22 @@
+from benchmark import compare, run
+from synthetic import synthetic_players
+import unittest
+
+class TestBenchmark(unittest.TestCase):
+    def test_synthetic_players_are_seeded(self):
+        first = [str(player) for player in synthetic_players(20, seed=1)]
+        second = [str(player) for player in synthetic_players(20, seed=1)]
+        self.assertEqual(first, second)
+
+    def test_run_small_roster(self):
+        results = run([50], seed=1)
+        self.assertIn("50/parse_ms", results)
+        self.assertIn("50/columnar/top_assists_ms", results)
+
+    def test_compare_flags_slowdowns_over_threshold(self):
+        baseline = {"a": 10.0, "b": 10.0, "c": 0.01}
+        results = {"a": 11.0, "b": 13.0, "c": 1.0, "d": 5.0}
+        self.assertEqual(compare(results, baseline, 0.2), [("b", 10.0, 13.0)])
+
+if __name__ == "__main__":
+    unittest.main()
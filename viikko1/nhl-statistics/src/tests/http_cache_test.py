@@ -0,0 +1,92 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from http_cache import HttpCache
+from player_reader import PlayerReader
+import shutil
+import tempfile
+import threading
+import unittest
+
+class PlayersHandler(BaseHTTPRequestHandler):
+    body = b"Semenko;EDM;CAN;4;12\nLemieux;PIT;CAN;45;54\n"
+    etag = '"v1"'
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(self.headers.get("If-None-Match"))
+
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+class TestHttpCache(unittest.TestCase):
+    def setUp(self):
+        PlayersHandler.requests = []
+        PlayersHandler.etag = '"v1"'
+        PlayersHandler.body = b"Semenko;EDM;CAN;4;12\nLemieux;PIT;CAN;45;54\n"
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), PlayersHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/players.txt"
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.directory)
+
+    def names(self, cache):
+        return [player.name for player in PlayerReader(self.url, cache=cache).get_players()]
+
+    def test_fresh_copy_is_served_without_request(self):
+        cache = HttpCache(self.directory, max_age=60)
+
+        self.assertEqual(self.names(cache), ["Semenko", "Lemieux"])
+        self.assertEqual(self.names(cache), ["Semenko", "Lemieux"])
+        self.assertEqual(PlayersHandler.requests, [None])
+
+    def test_stale_copy_is_revalidated_with_etag(self):
+        cache = HttpCache(self.directory, max_age=0)
+
+        self.names(cache)
+        self.assertEqual(self.names(cache), ["Semenko", "Lemieux"])
+        self.assertEqual(PlayersHandler.requests, [None, '"v1"'])
+
+    def test_changed_body_replaces_cached_copy(self):
+        cache = HttpCache(self.directory, max_age=0)
+
+        self.names(cache)
+        PlayersHandler.etag = '"v2"'
+        PlayersHandler.body = b"Kurri;EDM;FIN;37;53\n"
+
+        self.assertEqual(self.names(cache), ["Kurri"])
+
+    def test_stale_while_revalidate_serves_old_copy(self):
+        cache = HttpCache(self.directory, max_age=0, stale_while_revalidate=True)
+
+        self.names(cache)
+        PlayersHandler.etag = '"v2"'
+        PlayersHandler.body = b"Kurri;EDM;FIN;37;53\n"
+
+        self.assertEqual(self.names(cache), ["Semenko", "Lemieux"])
+        cache.wait()
+        self.assertEqual(self.names(cache), ["Kurri"])
+        cache.wait()
+
+    def test_cache_survives_new_instance(self):
+        self.names(HttpCache(self.directory, max_age=60))
+
+        self.assertEqual(self.names(HttpCache(self.directory, max_age=60)), ["Semenko", "Lemieux"])
+        self.assertEqual(len(PlayersHandler.requests), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+from nhl_sources import SourceReader, open_source
+from player_reader import PlayerReader, create_player
+from statistics_service import StatisticsService
+import json
+import os
+import tempfile
+import unittest
+
+PLAYERS_TXT = (
+    b"Semenko;EDM;CAN;4;12;0\n"
+    b"Lemieux; PIT ;CAN; 45 ;54\n"
+    b"broken line\n"
+    b"Kurri;EDM;FIN;x;53\n"
+    b"Yzerman;DET;CAN;42\n"
+    b"\n"
+    b"Gretzky;EDM;CAN;35;89"
+)
+
+class TestPlayerReader(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(handle, "wb") as players_file:
+            players_file.write(PLAYERS_TXT)
+
+        self.reader = PlayerReader("file://" + self.path)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_get_players(self):
+        players = self.reader.get_players()
+        self.assertEqual(
+            [str(player) for player in players],
+            ["Semenko EDM 4 + 12 = 16", "Lemieux PIT 45 + 54 = 99", "Gretzky EDM 35 + 89 = 124"]
+        )
+
+    def test_nationality(self):
+        players = self.reader.get_players()
+        self.assertEqual([player.nationality for player in players], ["CAN", "CAN", "CAN"])
+
+    def test_iter_players_is_lazy(self):
+        players = self.reader.iter_players()
+        self.assertEqual(next(players).name, "Semenko")
+
+    def test_source_reader_reads_json(self):
+        json_path = self.path + ".json"
+        with open(json_path, "w", encoding="utf-8") as json_file:
+            json.dump([{"name": "Kurri", "nationality": "FIN", "team": "EDM", "goals": 37, "assists": 53}], json_file)
+
+        try:
+            stats = StatisticsService(SourceReader(open_source(json_path), create_player))
+            self.assertEqual(str(stats.search("Kurri")), "Kurri EDM 37 + 53 = 90")
+        finally:
+            os.remove(json_path)
+
+if __name__ == "__main__":
+    unittest.main()
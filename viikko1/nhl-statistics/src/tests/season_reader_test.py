@@ -0,0 +1,62 @@
+from season_reader import MultiSeasonReader
+from statistics_service import StatisticsService, SortBy
+import os
+import tempfile
+import unittest
+
+SEASONS = {
+    "1985-86": b"Gretzky;EDM;CAN;52;163\nKurri;EDM;FIN;68;63\nLemieux;PIT;CAN;48;93\n",
+    "1986-87": b"Gretzky;EDM;CAN;62;121\nKurri;EDM;FIN;54;54\nLemieux;PIT;CAN;54;53\n"
+}
+
+class TestMultiSeasonReader(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+        for season, data in SEASONS.items():
+            with open(os.path.join(self.directory.name, f"{season}.txt"), "wb") as season_file:
+                season_file.write(data)
+
+        self.url_template = "file://" + self.directory.name + "/{season}.txt"
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_seasons_are_merged_in_order(self):
+        reader = MultiSeasonReader(["1986-87", "1985-86"], self.url_template)
+        players = reader.get_players()
+
+        self.assertEqual([player.season for player in players], ["1986-87"] * 3 + ["1985-86"] * 3)
+        self.assertEqual(reader.failures, {})
+
+    def test_failed_season_is_reported(self):
+        reader = MultiSeasonReader(["1985-86", "1999-00", "1986-87"], self.url_template)
+        players = reader.get_players()
+
+        self.assertEqual(len(players), 6)
+        self.assertEqual(list(reader.failures), ["1999-00"])
+
+    def test_statistics_by_season(self):
+        for columnar in (False, True):
+            stats = StatisticsService(
+                MultiSeasonReader(SEASONS, self.url_template, max_workers=2),
+                columnar=columnar
+            )
+
+            self.assertEqual(stats.seasons(), ["1985-86", "1986-87"])
+            self.assertEqual(len(stats.team("EDM")), 4)
+            self.assertEqual([player.season for player in stats.team("EDM", "1986-87")], ["1986-87"] * 2)
+            self.assertEqual(stats.team("PIT", "1999-00"), [])
+
+            top_scorer = stats.top(1, SortBy.GOALS, season="1986-87")[0]
+            self.assertEqual((top_scorer.name, top_scorer.season), ("Gretzky", "1986-87"))
+
+            groups = stats.aggregate("team", top=1, season="1986-87")
+            self.assertEqual((groups["EDM"].count, groups["EDM"].goals), (2, 116))
+            self.assertEqual(groups["PIT"].top[0].season, "1986-87")
+
+            top_scorer = stats.top(1, SortBy.GOALS)[0]
+            self.assertEqual((top_scorer.name, top_scorer.season), ("Kurri", "1985-86"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+from nhl_sources import Snapshot, open_source, write_snapshot
+from snapshot import SnapshotReader
+from statistics_service import StatisticsService, SortBy
+import json
+import os
+import tempfile
+import unittest
+
+ROWS = [
+    ("Semenko", "EDM", "CAN", 4, 12),
+    ("Lemieux", "PIT", "CAN", 45, 54),
+    ("Kurri", "EDM", "FIN", 37, 53),
+    ("Yzerman", "DET", "CAN", 42, 56),
+    ("Gretzky", "EDM", "CAN", 35, 89)
+]
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "players.snap")
+        write_snapshot(ROWS, self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_columns(self):
+        snapshot = Snapshot(self.path)
+        self.assertEqual(len(snapshot), 5)
+        self.assertEqual(list(snapshot.column("goals")), [4, 45, 37, 42, 35])
+        self.assertEqual(snapshot.strings("teams"), ["EDM", "PIT", "DET"])
+        self.assertEqual(snapshot.strings("nationalities"), ["CAN", "FIN"])
+
+    def test_statistics_service_from_snapshot(self):
+        stats = StatisticsService(SnapshotReader(self.path))
+
+        self.assertEqual([player.name for player in stats.team("EDM")], ["Semenko", "Kurri", "Gretzky"])
+        self.assertEqual([player.name for player in stats.top(2, SortBy.GOALS)], ["Lemieux", "Yzerman"])
+        self.assertEqual(str(stats.search("Kurri")), "Kurri EDM 37 + 53 = 90")
+        self.assertEqual([player.name for player in stats.players_by("nationality", "FIN")], ["Kurri"])
+        self.assertEqual(stats.aggregate("nationality")["CAN"].count, 4)
+
+    def test_refresh_from_snapshot(self):
+        stats = StatisticsService(SnapshotReader(self.path))
+        stats.team("EDM")
+        write_snapshot(ROWS[:4] + [("Gretzky", "LAK", "CAN", 35, 89), ("Messier", "EDM", "CAN", 23, 40)], self.path)
+
+        result = stats.refresh()
+
+        self.assertEqual((result.changed, result.added, result.removed), (1, 1, 0))
+        self.assertEqual([player.name for player in stats.team("EDM")], ["Semenko", "Kurri", "Messier"])
+
+    def test_refresh_unchanged_snapshot(self):
+        stats = StatisticsService(SnapshotReader(self.path))
+        write_snapshot(ROWS, self.path)
+
+        self.assertEqual(tuple(stats.refresh()), (0, 0, 0))
+
+    def test_not_a_snapshot(self):
+        with open(self.path, "wb") as snapshot_file:
+            snapshot_file.write(b"Semenko;EDM;CAN;4;12\n" * 10)
+
+        with self.assertRaises(ValueError):
+            Snapshot(self.path)
+
+    def assert_snapshot_of(self, source):
+        write_snapshot(open_source(source).records(), self.path)
+        players = SnapshotReader(self.path).get_players()
+
+        self.assertEqual([(player.name, player.team, player.goals, player.assists) for player in players], [("Kurri", "EDM", 37, 53)])
+
+    def test_snapshot_from_json(self):
+        json_path = os.path.join(self.directory.name, "players.json")
+        with open(json_path, "w", encoding="utf-8") as json_file:
+            json.dump([{"name": "Kurri", "nationality": "FIN", "team": "EDM", "goals": 37, "assists": 53}], json_file)
+
+        self.assert_snapshot_of(json_path)
+
+    def test_snapshot_from_text(self):
+        text_path = os.path.join(self.directory.name, "players.txt")
+        with open(text_path, "wb") as text_file:
+            text_file.write(b"Kurri;EDM;FIN;37;53\n")
+
+        self.assert_snapshot_of(text_path)
+
+if __name__ == "__main__":
+    unittest.main()
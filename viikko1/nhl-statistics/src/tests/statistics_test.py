@@ -1,42 +1,221 @@
-from statistics_service import StatisticsService
+from statistics_service import StatisticsService, SortBy
 from player_reader import PlayerReader
 from player import Player
 import unittest
 
 class PlayerReaderStub:
-    def get_players(self):
-        return [
-            Player("Semenko", "EDM", 4, 12),  #  4+12 = 16
-            Player("Lemieux", "PIT", 45, 54), # 45+54 = 99
-            Player("Kurri",   "EDM", 37, 53), # 37+53 = 90
-            Player("Yzerman", "DET", 42, 56), # 42+56 = 98
-            Player("Gretzky", "EDM", 35, 89)  # 35+89 = 124
+    def __init__(self):
+        self.players = [
+            Player("Semenko", "EDM", 4, 12, nationality="CAN"),  #  4+12 = 16
+            Player("Lemieux", "PIT", 45, 54, nationality="CAN"), # 45+54 = 99
+            Player("Kurri",   "EDM", 37, 53, nationality="FIN"), # 37+53 = 90
+            Player("Yzerman", "DET", 42, 56, nationality="CAN"), # 42+56 = 98
+            Player("Gretzky", "EDM", 35, 89, nationality="CAN")  # 35+89 = 124
         ]
 
+    def get_players(self):
+        return list(self.players)
+
 class TestStatisticsService(unittest.TestCase):
     def setUp(self):
         # annetaan StatisticsService-luokan oliolle "stub"-luokan olio
+        self.reader = PlayerReaderStub()
         self.stats = StatisticsService(
-            PlayerReaderStub()
+            self.reader
         )
 
     def test_search(self):
         player_search = self.stats.search("Lemieux")
         self.assertEqual(player_search.name, "Lemieux")
+        self.assertEqual(player_search.points, 99)
 
     def test_search_no_player(self):
         player_search = self.stats.search("Player")
         self.assertEqual(player_search, None)
 
+    def test_search_all(self):
+        players = self.stats.search_all("e")
+        expected_list = ["Semenko", "Lemieux", "Yzerman", "Gretzky"]
+        self.assertEqual([player.name for player in players], expected_list)
+
+    def test_search_all_substring(self):
+        players = self.stats.search_all("emi")
+        self.assertEqual([player.name for player in players], ["Lemieux"])
+
+    def test_search_all_prefix(self):
+        players = self.stats.search_all("Ku", prefix=True)
+        self.assertEqual([player.name for player in players], ["Kurri"])
+        self.assertEqual(self.stats.search_all("urri", prefix=True), [])
+
+    def test_search_all_ignore_case(self):
+        self.assertEqual(self.stats.search_all("gretzky"), [])
+        players = self.stats.search_all("gretzky", ignore_case=True)
+        self.assertEqual([player.name for player in players], ["Gretzky"])
+
+    def test_search_all_greek_final_sigma(self):
+        self.reader.players.append(Player("ΟΔΥΣΣΕΥΣ", "ITH", 1, 1))
+        self.stats.reload()
+        self.assertEqual(self.stats.search("ΥΣΣ").name, "ΟΔΥΣΣΕΥΣ")
+        players = self.stats.search_all("υσσ", ignore_case=True)
+        self.assertEqual([player.name for player in players], ["ΟΔΥΣΣΕΥΣ"])
+
+    def test_search_all_limit(self):
+        players = self.stats.search_all("e", limit=2)
+        self.assertEqual([player.name for player in players], ["Semenko", "Lemieux"])
+
     def test_team(self):
         test_EDM_list = self.stats.team("EDM") 
         expected_list = ["Semenko", "Kurri", "Gretzky"]
         self.assertEqual([player.name for player in test_EDM_list], expected_list)
 
+    def test_team_unknown(self):
+        self.assertEqual(self.stats.team("NYR"), [])
+
+    def test_team_after_reload(self):
+        self.stats.team("EDM")
+        self.reader.players.append(Player("Messier", "EDM", 23, 40))
+        self.stats.reload()
+        self.assertEqual(len(self.stats.team("EDM")), 4)
+
     def test_top(self):
         top_scorers = self.stats.top(2)
         expected_list = ["Gretzky", "Lemieux"]
         self.assertEqual([player.name for player in top_scorers], expected_list)
 
+    def test_top_more_than_players(self):
+        top_scorers = self.stats.top(10)
+        self.assertEqual(len(top_scorers), 5)
+
+    def test_top_zero(self):
+        self.assertEqual(self.stats.top(0), [])
+
+    def test_top_repeated_calls(self):
+        for _ in range(3):
+            top_scorers = self.stats.top(3, SortBy.ASSISTS)
+            expected_list = ["Gretzky", "Yzerman", "Lemieux"]
+            self.assertEqual([player.name for player in top_scorers], expected_list)
+
+    def test_top_after_reload(self):
+        self.stats.top(1)
+        self.stats.top(1)
+        self.reader.players.append(Player("Ovechkin", "WSH", 90, 60))
+        self.stats.reload()
+        self.assertEqual(self.stats.top(1)[0].name, "Ovechkin")
+
+    def test_aggregate_by_team(self):
+        groups = self.stats.aggregate("team", top=2)
+
+        self.assertEqual(list(groups), ["EDM", "PIT", "DET"])
+        edm = groups["EDM"]
+        self.assertEqual((edm.count, edm.goals, edm.assists, edm.points), (3, 76, 154, 230))
+        self.assertAlmostEqual(edm.average_points, 230 / 3)
+        self.assertEqual([player.name for player in edm.top], ["Gretzky", "Kurri"])
+        self.assertEqual([player.name for player in groups["PIT"].top], ["Lemieux"])
+
+    def test_aggregate_top_by_goals(self):
+        groups = self.stats.aggregate("team", top=1, sort_by=SortBy.GOALS)
+        self.assertEqual(groups["EDM"].top[0].name, "Kurri")
+
+    def test_aggregate_python_and_vectorized_agree(self):
+        vectorized = self.stats.aggregate("team", top=3, sort_by=SortBy.ASSISTS)
+        python = self.stats.aggregate("team", top=3, sort_by=SortBy.ASSISTS, vectorized=False)
+
+        self.assertEqual(
+            {key: (str(group), [str(player) for player in group.top]) for key, group in vectorized.items()},
+            {key: (str(group), [str(player) for player in group.top]) for key, group in python.items()}
+        )
+
+    def test_players_by_nationality(self):
+        players = self.stats.players_by("nationality", "CAN")
+        self.assertEqual([player.name for player in players], ["Semenko", "Lemieux", "Yzerman", "Gretzky"])
+        self.assertEqual(self.stats.players_by("nationality", "SWE"), [])
+
+    def test_aggregate_by_nationality(self):
+        for vectorized in (True, False):
+            groups = self.stats.aggregate("nationality", top=1, vectorized=vectorized)
+
+            self.assertEqual(list(groups), ["CAN", "FIN"])
+            self.assertEqual((groups["FIN"].count, groups["FIN"].points), (1, 90))
+            self.assertEqual(groups["CAN"].top[0].name, "Gretzky")
+
+    def test_aggregate_unknown_season(self):
+        self.assertEqual(self.stats.aggregate("team", season="1999-00"), {})
+
+    def assert_same_as_reloaded(self):
+        fresh = StatisticsService(self.reader, columnar=isinstance(self, TestColumnarStatisticsService))
+
+        for sort_by in SortBy:
+            self.assertEqual(
+                [str(player) for player in self.stats.top(10, sort_by)],
+                [str(player) for player in fresh.top(10, sort_by)]
+            )
+
+        for team in ["EDM", "PIT", "DET", "WSH"]:
+            self.assertEqual(
+                [str(player) for player in self.stats.team(team)],
+                [str(player) for player in fresh.team(team)]
+            )
+
+        self.assertEqual(
+            [str(player) for player in self.stats.search_all("e")],
+            [str(player) for player in fresh.search_all("e")]
+        )
+
+    def warm_up(self):
+        # rakennetaan indeksit ja järjestykset ennen päivitystä
+        for sort_by in SortBy:
+            self.stats.top(1, sort_by)
+            self.stats.top(1, sort_by)
+        self.stats.team("EDM")
+        self.stats.search("e")
+
+    def test_refresh_without_changes(self):
+        self.warm_up()
+        self.assertEqual(tuple(self.stats.refresh()), (0, 0, 0))
+
+    def test_refresh_changed_and_added_rows(self):
+        self.warm_up()
+        self.reader.players[0] = Player("Semenko", "WSH", 4, 80)
+        self.reader.players[2] = Player("Kurri", "EDM", 60, 53)
+        self.reader.players.append(Player("Ovechkin", "WSH", 90, 60))
+
+        result = self.stats.refresh()
+
+        self.assertEqual((result.changed, result.added, result.removed), (2, 1, 0))
+        self.assert_same_as_reloaded()
+
+    def test_refresh_removed_rows(self):
+        self.warm_up()
+        del self.reader.players[1]
+
+        result = self.stats.refresh()
+
+        self.assertEqual(result.removed, 1)
+        self.assert_same_as_reloaded()
+
+    def test_refresh_reordered_rows(self):
+        self.warm_up()
+        self.reader.players.reverse()
+        self.reader.players.insert(2, Player("Ovechkin", "WSH", 90, 60))
+
+        result = self.stats.refresh()
+
+        self.assertEqual((result.changed, result.added, result.removed), (0, 1, 0))
+        self.assert_same_as_reloaded()
+
+class TestColumnarStatisticsService(TestStatisticsService):
+    def setUp(self):
+        # sama testisarja sarakkeittain tallentavalla toteutuksella
+        self.reader = PlayerReaderStub()
+        self.stats = StatisticsService(
+            self.reader,
+            columnar=True
+        )
+
+    def test_top_by_goals(self):
+        top_scorers = self.stats.top(3, SortBy.GOALS)
+        expected_list = ["Lemieux", "Yzerman", "Kurri"]
+        self.assertEqual([player.name for player in top_scorers], expected_list)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,36 @@
+import argparse
+import json
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+DEFAULT_PORT = 8765
+
+
+# kevyt asiakas: ei requests- eikä rich-tuontia, joten käynnistys on nopea
+def query(nationality, how_many=None, port=DEFAULT_PORT, timeout=5):
+    parameters = {"nationality": nationality}
+
+    if how_many is not None:
+        parameters["top"] = how_many
+
+    with urlopen(f"http://127.0.0.1:{port}/top?{urlencode(parameters)}", timeout=timeout) as response:
+        return json.load(response)
+
+
+def format_player(player):
+    return f"{player['name']:20}, {player['team']:15}, {player['goals']} + {player['assists']} = {player['points']}"
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Query a running nhl-reader daemon")
+    parser.add_argument("nationality")
+    parser.add_argument("--top", type=int)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    options = parser.parse_args(arguments)
+
+    for player in query(options.nationality, options.top, options.port):
+        print(format_player(player))
+
+
+if __name__ == "__main__":
+    main()
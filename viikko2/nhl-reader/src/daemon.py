@@ -0,0 +1,138 @@
+import argparse
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from player_stats import PlayerStats
+from player_reader import PlayerReader
+from client import DEFAULT_PORT
+from export import DEFAULT_URL
+
+
+def player_dict(player):
+    return {
+        "name": player.name,
+        "nationality": player.nationality,
+        "team": player.team,
+        "goals": player.goals,
+        "assists": player.assists,
+        "points": player.points
+    }
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    def _send_json(self, status, value):
+        body = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _top_scorers(self, query):
+        stats = self.server.stats
+        nationality = query.get("nationality", [""])[0]
+        how_many = int(query["top"][0]) if "top" in query else None
+
+        if how_many is not None and how_many < 0:
+            raise ValueError("top must not be negative")
+
+        return [player_dict(player) for player in stats.top_scorers_by_nationality(nationality, how_many)]
+
+    def _status(self):
+        stats = self.server.stats
+        return {"version": stats.version, "nationalities": stats.nationalities(), "cache": stats.cache_info()._asdict()}
+
+    def _respond(self, url):
+        if url.path == "/top":
+            return 200, self._top_scorers(parse_qs(url.query))
+        if url.path == "/status":
+            return 200, self._status()
+
+        return 404, {"error": f"unknown path {url.path}"}
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        try:
+            status, value = self._respond(urlparse(self.path))
+        except ValueError as error:
+            status, value = 400, {"error": str(error)}
+
+        self._send_json(status, value)
+
+    def log_message(self, *args):
+        pass
+
+
+class QueryServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, stats):
+        super().__init__(address, QueryHandler)
+        self.stats = stats
+
+
+class Refresher:
+    def __init__(self, stats, interval):
+        self.stats = stats
+        self.interval = interval
+        self.failures = 0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def refresh(self):
+        # PlayerStats vaihtaa uudet ositukset käyttöön vasta valmiina,
+        # joten käynnissä olevat kyselyt näkevät joko vanhan tai uuden datan.
+        # Mikä tahansa virhe (esim. muuttunut JSON-rakenne) vain kirjataan,
+        # jotta päivityssäie ei pysähdy ja jätä palvelinta vanhaan dataan
+        try:
+            return self.stats.reload()
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self.failures += 1
+            print(f"refresh failed, keeping previous data: {error}", file=sys.stderr)
+            return False
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.refresh()
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
+
+def parse_arguments(arguments):
+    parser = argparse.ArgumentParser(description="Keep player statistics loaded and answer queries over localhost HTTP")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--refresh", type=float, default=300, help="seconds between data refreshes")
+    parser.add_argument("--url", default=DEFAULT_URL)
+
+    return parser.parse_args(arguments)
+
+
+def serve(server, refresher):
+    refresher.start()
+    print(f"serving on http://127.0.0.1:{server.server_port}", file=sys.stderr)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        refresher.stop()
+
+
+def main(arguments=None):
+    options = parse_arguments(arguments)
+    stats = PlayerStats(PlayerReader(options.url))
+
+    with QueryServer(("127.0.0.1", options.port), stats) as server:
+        serve(server, Refresher(stats, options.refresh))
+
+
+if __name__ == "__main__":
+    main()
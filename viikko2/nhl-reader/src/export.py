@@ -0,0 +1,97 @@
+import argparse
+import csv
+import json
+import sys
+
+from player_stats import PlayerStats
+from player_reader import PlayerReader
+
+DEFAULT_URL = "https://studies.cs.helsinki.fi/nhlstats/2024-25/players"
+FIELDS = ["nationality", "rank", "name", "team", "goals", "assists", "points"]
+
+
+def export_rows(stats, nationalities, how_many=None):
+    for nationality in nationalities:
+        players = stats.top_scorers_by_nationality(nationality, how_many)
+
+        for rank, player in enumerate(players, start=1):
+            yield {
+                "nationality": nationality,
+                "rank": rank,
+                "name": player.name,
+                "team": player.team,
+                "goals": player.goals,
+                "assists": player.assists,
+                "points": player.points
+            }
+
+
+def write_csv(rows, output):
+    writer = csv.DictWriter(output, fieldnames=FIELDS, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def write_ndjson(rows, output):
+    for row in rows:
+        output.write(json.dumps(row, ensure_ascii=False))
+        output.write("\n")
+
+
+def write_json(rows, output):
+    # taulukko kirjoitetaan alkio kerrallaan, joten rivejä ei kerätä muistiin
+    separator = "\n"
+    output.write("[")
+
+    for row in rows:
+        output.write(separator + json.dumps(row, ensure_ascii=False))
+        separator = ",\n"
+
+    output.write("\n]\n")
+
+
+WRITERS = {"csv": write_csv, "json": write_json, "ndjson": write_ndjson}
+
+
+def create_parser():
+    parser = argparse.ArgumentParser(description="Export top scorers by nationality without the interactive UI")
+    parser.add_argument("nationalities", nargs="*", help="nationalities to export, e.g. FIN SWE")
+    parser.add_argument("--all", action="store_true", help="export every nationality in the data")
+    parser.add_argument("--format", choices=sorted(WRITERS), default="csv")
+    parser.add_argument("--top", type=int, help="export at most this many players per nationality")
+    parser.add_argument("--output", help="write to this file instead of stdout")
+    parser.add_argument("--url", default=DEFAULT_URL)
+
+    return parser
+
+
+def parse_arguments(arguments):
+    parser = create_parser()
+    options = parser.parse_args(arguments)
+
+    if not options.all and not options.nationalities:
+        parser.error("give at least one nationality or --all")
+    if options.top is not None and options.top < 0:
+        parser.error("--top must not be negative")
+
+    return options
+
+
+def export(stats, options, output):
+    nationalities = stats.nationalities() if options.all else options.nationalities
+    WRITERS[options.format](export_rows(stats, nationalities, options.top), output)
+
+
+def main(arguments=None):
+    options = parse_arguments(arguments)
+    stats = PlayerStats(PlayerReader(options.url))
+
+    if options.output:
+        with open(options.output, "w", encoding="utf-8", newline="") as output:
+            export(stats, options, output)
+    else:
+        export(stats, options, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
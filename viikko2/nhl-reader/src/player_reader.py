@@ -1,17 +1,126 @@
+import asyncio
+import time
+from functools import cache
 import requests
+from requests.exceptions import RetryError
+from requests.adapters import HTTPAdapter
+from nhl_sources import PlayerRecord, parse_any
 from player import Player
 
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+CHUNK_SIZE = 64 * 1024
+
+
+def create_player(*fields):
+    # kentät tulevat PlayerRecordin järjestyksessä
+    return Player(dict(zip(PlayerRecord._fields, fields)))
+
+
+class RetryPolicy:
+    def __init__(self, retries=3, backoff=0.5, timeout=10, deadline=30):
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.deadline = deadline
+
+    def delay(self, attempt):
+        return self.backoff * 2 ** attempt
+
+
+class RetryableError(Exception):
+    pass
+
+
+def create_session(pool_size=10):
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
+@cache
+def shared_session():
+    # kaikki lukijat käyttävät oletuksena samaa yhteysvarantoa
+    return create_session()
+
+
 class PlayerReader:
-    def __init__(self, url):
+    def __init__(self, url, session=None, policy=None):
         self._url = url
+        self._session = session or shared_session()
+        self._policy = policy or RetryPolicy()
 
-    def get_players(self):
-        response = requests.get(self._url, timeout=10).json()
+    def _get(self, deadline, stream):
+        timeout = min(self._policy.timeout, deadline - time.monotonic())
+
+        if timeout <= 0:
+            raise requests.Timeout(f"deadline exceeded for {self._url}")
 
-        players = []
+        try:
+            return self._session.get(self._url, timeout=timeout, stream=stream)
+        except (requests.ConnectionError, requests.Timeout) as error:
+            raise RetryableError(error) from error
 
-        for player_dict in response:
-            player = Player(player_dict)
-            players.append(player)
+    def _attempt(self, deadline, stream=False):
+        response = self._get(deadline, stream)
+
+        if response.status_code in RETRY_STATUSES:
+            response.close()
+            raise RetryableError(f"{response.status_code} from {self._url}")
+
+        response.raise_for_status()
+
+        return response
+
+    def _backoff(self, attempt, deadline, error):
+        delay = self._policy.delay(attempt)
+
+        if attempt >= self._policy.retries or time.monotonic() + delay >= deadline:
+            raise RetryError(f"giving up on {self._url} after {attempt + 1} attempts") from error
+
+        return delay
+
+    def _request(self, stream=False):
+        deadline = time.monotonic() + self._policy.deadline
+        attempt = 0
+
+        while True:
+            try:
+                return self._attempt(deadline, stream)
+            except RetryableError as error:
+                time.sleep(self._backoff(attempt, deadline, error))
+                attempt += 1
+
+    def fetch(self):
+        return self._request().json()
+
+    async def fetch_async(self):
+        # requests on estävä, joten yksittäiset yritykset ajetaan säikeessä;
+        # odotukset ja uudelleenyritykset hoidetaan tapahtumasilmukassa
+        deadline = time.monotonic() + self._policy.deadline
+        attempt = 0
+
+        while True:
+            try:
+                response = await asyncio.to_thread(self._attempt, deadline)
+                return response.json()
+            except RetryableError as error:
+                await asyncio.sleep(self._backoff(attempt, deadline, error))
+                attempt += 1
+
+    def records(self, factory=PlayerRecord):
+        # vastaus luetaan paloittain, joten koko taulukkoa ei pidetä muistissa;
+        # näin lukija kelpaa myös nhl_sources-lähteeksi uudelleenyrityksineen
+        with self._request(stream=True) as response:
+            yield from parse_any(response.iter_content(CHUNK_SIZE), factory)
+
+    def iter_players(self):
+        return self.records(create_player)
+
+    def get_players(self):
+        return [Player(player_dict) for player_dict in self.fetch()]
 
-        return players
+    async def get_players_async(self):
+        return [Player(player_dict) for player_dict in await self.fetch_async()]
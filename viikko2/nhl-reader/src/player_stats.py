@@ -1,14 +1,70 @@
+from nhl_sources import ResultCache
 from player_reader import PlayerReader
 
+
+def player_key(player):
+    return (player.name, player.nationality, player.team, player.goals, player.assists)
+
+
+def partition_by_nationality(players):
+    partitions = {}
+
+    for player in players:
+        partitions.setdefault(player.nationality, []).append(player)
+
+    # vakaa lajittelu säilyttää lukujärjestyksen tasapisteissä
+    for partition in partitions.values():
+        partition.sort(key=lambda player: player.points, reverse=True)
+
+    return partitions
+
+
 class PlayerStats():
-    def __init__(self, player_reader : PlayerReader):
+    def __init__(self, player_reader : PlayerReader, cache_size=128):
         self.reader = player_reader
+        self.version = 0
+        self.cache = ResultCache(cache_size)
+        self._players = []
+        self._keys = []
+        self._partitions = {}
+
+        self.reload()
+
+    def reload(self):
+        players = self.reader.get_players()
+        keys = [player_key(player) for player in players]
+
+        # ositukset rakennetaan uudelleen vain, jos data on oikeasti muuttunut
+        if keys == self._keys:
+            return False
+
+        self._players = players
+        self._keys = keys
+        self._partitions = partition_by_nationality(players)
+        self.version += 1
+
+        return True
+
+    def nationalities(self):
+        return sorted(self._partitions)
+
+    def _top_scorers(self, nationality, how_many):
+        partition = self._partitions.get(nationality)
+
+        if partition is None:
+            return ()
 
-        self._players = self.reader.get_players()
+        return tuple(partition[:how_many])
 
-    def top_scorers_by_nationality(self, nationality):
-        filtered_by_nationality = filter(lambda player: player.nationality == nationality, self._players)
+    def top_scorers_by_nationality(self, nationality, how_many=None):
+        result = self.cache.get(
+            ("top_scorers_by_nationality", nationality, how_many),
+            self.version,
+            lambda: self._top_scorers(nationality, how_many)
+        )
 
-        sort_by_points = sorted(list(filtered_by_nationality), key=lambda player: player.points, reverse=True)
+        # välimuistin tulos on muuttumaton, kutsuja saa oman listansa
+        return list(result)
 
-        return sort_by_points
+    def cache_info(self):
+        return self.cache.info()
@@ -0,0 +1,71 @@
+from rich.align import Align
+from rich.table import Table
+
+COLUMNS = [
+    ("Released", {"no_wrap": True}),
+    ("Teams", {"no_wrap": True}),
+    ("Goals", {"justify": "right", "no_wrap": True}),
+    ("Assists", {"justify": "right", "no_wrap": True}),
+    ("Points", {"justify": "right", "no_wrap": True})
+]
+
+# otsikko, reunat ja sivutieto vievät nämä rivit konsolista
+RESERVED_LINES = 8
+
+
+def player_row(player):
+    return (
+        f"[cyan]{player.name}[/]",
+        f"[magenta]{player.team}",
+        f"[green]{player.goals}",
+        f"[green]{player.assists}",
+        f"[green]{player.points}"
+    )
+
+
+class PlayerTable:
+    def __init__(self, console, page_size=None):
+        self.console = console
+        self.page_size = page_size or max(console.height - RESERVED_LINES, 1)
+        self.page = 0
+        self._players = []
+        self._rows = {}
+
+    def show(self, players):
+        self._players = players
+        self.page = 0
+
+    @property
+    def pages(self):
+        return max((len(self._players) + self.page_size - 1) // self.page_size, 1)
+
+    def turn(self, step):
+        self.page = min(max(self.page + step, 0), self.pages - 1)
+
+    def _row(self, player):
+        # merkintä muodostetaan kerran pelaajaa kohden, ei joka piirrolla
+        row = self._rows.get(player)
+
+        if row is None:
+            row = self._rows[player] = player_row(player)
+
+        return row
+
+    def visible_players(self):
+        start = self.page * self.page_size
+        return self._players[start:start + self.page_size]
+
+    def build(self):
+        caption = f"{len(self._players)} players, page {self.page + 1}/{self.pages}"
+        table = Table(show_footer=False, caption=caption)
+
+        for header, options in COLUMNS:
+            table.add_column(header, **options)
+
+        for player in self.visible_players():
+            table.add_row(*self._row(player))
+
+        return Align.center(table)
+
+    def render(self):
+        self.console.print(self.build())
@@ -0,0 +1,122 @@
+import json
+import threading
+import time
+import unittest
+from urllib.error import HTTPError
+from urllib.request import urlopen
+import requests
+from player import Player
+from player_stats import PlayerStats
+from daemon import QueryServer, Refresher
+from client import query
+
+PLAYERS = [
+    {"name": "Saku Koivu", "nationality": "FIN", "team": "MTL", "goals": 20, "assists": 50},
+    {"name": "Teemu Selanne", "nationality": "FIN", "team": "ANA", "goals": 40, "assists": 54},
+    {"name": "Joe Sakic", "nationality": "CAN", "team": "COL", "goals": 40, "assists": 60}
+]
+
+class StubReader:
+    def __init__(self):
+        self.player_dicts = list(PLAYERS)
+        self.error = None
+
+    def get_players(self):
+        if self.error:
+            raise self.error
+        return [Player(player_dict) for player_dict in self.player_dicts]
+
+class TestDaemon(unittest.TestCase):
+    def setUp(self):
+        self.reader = StubReader()
+        self.stats = PlayerStats(self.reader)
+        self.server = QueryServer(("127.0.0.1", 0), self.stats)
+        self.port = self.server.server_port
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def get(self, path):
+        with urlopen(f"http://127.0.0.1:{self.port}{path}", timeout=5) as response:
+            return json.load(response)
+
+    def test_client_gets_top_scorers(self):
+        players = query("FIN", port=self.port)
+
+        self.assertEqual([player["name"] for player in players], ["Teemu Selanne", "Saku Koivu"])
+        self.assertEqual(players[0]["points"], 94)
+
+    def test_client_can_limit_results(self):
+        self.assertEqual(len(query("FIN", 1, port=self.port)), 1)
+
+    def test_unknown_nationality_returns_empty_list(self):
+        self.assertEqual(query("XYZ", port=self.port), [])
+
+    def test_status_reports_version_and_cache(self):
+        query("FIN", port=self.port)
+        status = self.get("/status")
+
+        self.assertEqual(status["version"], 1)
+        self.assertEqual(status["nationalities"], ["CAN", "FIN"])
+        self.assertEqual(status["cache"]["misses"], 1)
+
+    def test_bad_requests_are_rejected(self):
+        with self.assertRaises(HTTPError) as context:
+            self.get("/top?nationality=FIN&top=many")
+        self.assertEqual(context.exception.code, 400)
+
+        with self.assertRaises(HTTPError) as context:
+            self.get("/top?nationality=FIN&top=-1")
+        self.assertEqual(context.exception.code, 400)
+
+        with self.assertRaises(HTTPError) as context:
+            self.get("/unknown")
+        self.assertEqual(context.exception.code, 404)
+
+    def test_refresh_serves_new_data(self):
+        self.reader.player_dicts.append(
+            {"name": "Mikko Rantanen", "nationality": "FIN", "team": "COL", "goals": 50, "assists": 60}
+        )
+
+        self.assertTrue(Refresher(self.stats, 60).refresh())
+        self.assertEqual(query("FIN", 1, port=self.port)[0]["name"], "Mikko Rantanen")
+
+    def test_failed_refresh_keeps_previous_data(self):
+        self.reader.error = requests.ConnectionError("offline")
+        refresher = Refresher(self.stats, 60)
+
+        self.assertFalse(refresher.refresh())
+        self.assertEqual(refresher.failures, 1)
+        self.assertEqual(len(query("FIN", port=self.port)), 2)
+
+    def test_unexpected_refresh_error_keeps_refresher_running(self):
+        self.reader.error = KeyError("goals")
+        refresher = Refresher(self.stats, 0.01)
+        refresher.start()
+
+        deadline = time.monotonic() + 5
+        while refresher.failures < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.reader.error = None
+        self.reader.player_dicts.pop()
+        while self.stats.version == 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        refresher.stop()
+
+        self.assertGreaterEqual(refresher.failures, 2)
+        self.assertEqual(self.stats.nationalities(), ["FIN"])
+
+    def test_refresher_reloads_on_interval(self):
+        refresher = Refresher(self.stats, 0.01)
+        self.reader.player_dicts.pop()
+        refresher.start()
+
+        deadline = time.monotonic() + 5
+        while self.stats.version == 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        refresher.stop()
+
+        self.assertEqual(self.stats.nationalities(), ["FIN"])
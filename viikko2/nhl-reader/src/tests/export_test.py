@@ -0,0 +1,68 @@
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+import unittest
+from player import Player
+from player_stats import PlayerStats
+from export import export, parse_arguments
+
+PLAYERS = [
+    {"name": "Saku Koivu", "nationality": "FIN", "team": "MTL", "goals": 20, "assists": 50},
+    {"name": "Joe Sakic", "nationality": "CAN", "team": "COL", "goals": 40, "assists": 60},
+    {"name": "Teemu Selänne", "nationality": "FIN", "team": "ANA", "goals": 40, "assists": 54},
+    {"name": "Peter Forsberg", "nationality": "SWE", "team": "COL", "goals": 30, "assists": 70}
+]
+
+class StubReader:
+    def get_players(self):
+        return [Player(player_dict) for player_dict in PLAYERS]
+
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        self.stats = PlayerStats(StubReader())
+
+    def run_export(self, arguments):
+        output = io.StringIO()
+        export(self.stats, parse_arguments(arguments), output)
+        return output.getvalue()
+
+    def test_csv_has_header_and_ranked_rows(self):
+        rows = list(csv.DictReader(io.StringIO(self.run_export(["FIN"]))))
+
+        self.assertEqual([row["name"] for row in rows], ["Teemu Selänne", "Saku Koivu"])
+        self.assertEqual(rows[0]["rank"], "1")
+        self.assertEqual(rows[0]["points"], "94")
+
+    def test_ndjson_has_one_object_per_line(self):
+        lines = self.run_export(["--format", "ndjson", "CAN", "SWE"]).splitlines()
+
+        self.assertEqual([json.loads(line)["name"] for line in lines], ["Joe Sakic", "Peter Forsberg"])
+
+    def test_json_is_a_single_array(self):
+        rows = json.loads(self.run_export(["--format", "json", "--all", "--top", "1"]))
+
+        self.assertEqual([row["nationality"] for row in rows], ["CAN", "FIN", "SWE"])
+        self.assertEqual(rows[1]["name"], "Teemu Selänne")
+
+    def test_empty_json_export_is_valid(self):
+        self.assertEqual(json.loads(self.run_export(["--format", "json", "XYZ"])), [])
+
+    def test_nationality_or_all_is_required(self):
+        with self.assertRaises(SystemExit):
+            parse_arguments([])
+
+    def test_negative_top_is_rejected(self):
+        with self.assertRaises(SystemExit):
+            parse_arguments(["FIN", "--top", "-1"])
+
+    def test_export_does_not_import_rich(self):
+        source = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, export; print('rich' in sys.modules)"],
+            cwd=source, capture_output=True, text=True, check=True
+        )
+
+        self.assertEqual(result.stdout.strip(), "False")
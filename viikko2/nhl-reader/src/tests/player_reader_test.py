@@ -0,0 +1,114 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import asyncio
+import json
+import threading
+import time
+import unittest
+import requests
+from requests.exceptions import RetryError
+from player_reader import PlayerReader, RetryPolicy
+
+PLAYERS = [
+    {"name": "Teemu Selanne", "nationality": "FIN", "team": "ANA", "goals": 40, "assists": 54},
+    {"name": "Saku Koivu", "nationality": "FIN", "team": "MTL", "goals": 20, "assists": 50}
+]
+
+class StubHandler(BaseHTTPRequestHandler):
+    failures_left = 0
+    requests = 0
+
+    def do_GET(self):
+        StubHandler.requests += 1
+
+        if self.path == "/slow":
+            time.sleep(0.5)
+
+        if self.path == "/flaky" and StubHandler.failures_left > 0:
+            StubHandler.failures_left -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if self.path == "/missing":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = json.dumps(PLAYERS).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class TestPlayerReader(unittest.TestCase):
+    def setUp(self):
+        StubHandler.failures_left = 0
+        StubHandler.requests = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        self.policy = RetryPolicy(retries=3, backoff=0.01, timeout=1, deadline=5)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def reader(self, path, policy=None):
+        return PlayerReader(self.base_url + path, policy=policy or self.policy)
+
+    def test_get_players(self):
+        players = self.reader("/players").get_players()
+        self.assertEqual([player.name for player in players], ["Teemu Selanne", "Saku Koivu"])
+        self.assertEqual(players[0].points, 94)
+
+    def test_iter_players_streams(self):
+        players = self.reader("/players").iter_players()
+        self.assertEqual(next(players).name, "Teemu Selanne")
+        self.assertEqual([player.team for player in players], ["MTL"])
+
+    def test_iter_players_retries_before_streaming(self):
+        StubHandler.failures_left = 1
+        self.assertEqual(len(list(self.reader("/flaky").iter_players())), 2)
+
+    def test_retries_server_errors(self):
+        StubHandler.failures_left = 2
+        players = self.reader("/flaky").get_players()
+        self.assertEqual(len(players), 2)
+        self.assertEqual(StubHandler.requests, 3)
+
+    def test_gives_up_after_retries(self):
+        StubHandler.failures_left = 10
+        with self.assertRaises(RetryError):
+            self.reader("/flaky").get_players()
+        self.assertEqual(StubHandler.requests, 4)
+
+    def test_client_errors_are_not_retried(self):
+        with self.assertRaises(requests.HTTPError):
+            self.reader("/missing").get_players()
+        self.assertEqual(StubHandler.requests, 1)
+
+    def test_deadline_limits_total_time(self):
+        policy = RetryPolicy(retries=10, backoff=0.01, timeout=0.2, deadline=0.5)
+        start = time.monotonic()
+        with self.assertRaises(requests.RequestException):
+            self.reader("/slow", policy).get_players()
+        self.assertLess(time.monotonic() - start, 1.5)
+
+    def test_async_fetches_share_event_loop(self):
+        StubHandler.failures_left = 1
+
+        async def fetch_all():
+            readers = [self.reader("/players"), self.reader("/flaky"), self.reader("/players")]
+            return await asyncio.gather(*(reader.get_players_async() for reader in readers))
+
+        results = asyncio.run(fetch_all())
+        self.assertEqual([len(players) for players in results], [2, 2, 2])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+from nhl_sources import SourceReader, open_source
+from player_reader import create_player
+from player import Player
+from player_stats import PlayerStats
+
+PLAYERS = [
+    {"name": "Saku Koivu", "nationality": "FIN", "team": "MTL", "goals": 20, "assists": 50},
+    {"name": "Joe Sakic", "nationality": "CAN", "team": "COL", "goals": 40, "assists": 60},
+    {"name": "Teemu Selanne", "nationality": "FIN", "team": "ANA", "goals": 40, "assists": 54},
+    {"name": "Jari Kurri", "nationality": "FIN", "team": "EDM", "goals": 30, "assists": 40},
+    {"name": "Esa Tikkanen", "nationality": "FIN", "team": "EDM", "goals": 30, "assists": 40}
+]
+
+class StubReader:
+    def __init__(self, player_dicts):
+        self.player_dicts = player_dicts
+        self.calls = 0
+
+    def get_players(self):
+        self.calls += 1
+        return [Player(player_dict) for player_dict in self.player_dicts]
+
+class TestPlayerStats(unittest.TestCase):
+    def setUp(self):
+        self.reader = StubReader(list(PLAYERS))
+        self.stats = PlayerStats(self.reader)
+
+    def names(self, players):
+        return [player.name for player in players]
+
+    def test_top_scorers_are_sorted_by_points(self):
+        players = self.stats.top_scorers_by_nationality("FIN")
+
+        self.assertEqual(self.names(players), ["Teemu Selanne", "Saku Koivu", "Jari Kurri", "Esa Tikkanen"])
+
+    def test_how_many_limits_result(self):
+        players = self.stats.top_scorers_by_nationality("FIN", 2)
+
+        self.assertEqual(self.names(players), ["Teemu Selanne", "Saku Koivu"])
+
+    def test_unknown_nationality_returns_empty_list(self):
+        self.assertEqual(self.stats.top_scorers_by_nationality("XYZ"), [])
+
+    def test_result_can_be_modified_without_touching_partition(self):
+        self.stats.top_scorers_by_nationality("FIN").clear()
+
+        self.assertEqual(len(self.stats.top_scorers_by_nationality("FIN")), 4)
+
+    def test_nationalities(self):
+        self.assertEqual(self.stats.nationalities(), ["CAN", "FIN"])
+
+    def test_reload_without_changes_keeps_partitions(self):
+        partition = self.stats._partitions["FIN"]
+
+        self.assertFalse(self.stats.reload())
+        self.assertIs(self.stats._partitions["FIN"], partition)
+
+    def test_reload_rebuilds_partitions_when_data_changes(self):
+        self.reader.player_dicts.append(
+            {"name": "Mikko Rantanen", "nationality": "FIN", "team": "COL", "goals": 50, "assists": 60}
+        )
+
+        self.assertTrue(self.stats.reload())
+        self.assertEqual(self.names(self.stats.top_scorers_by_nationality("FIN", 1)), ["Mikko Rantanen"])
+
+    def test_repeated_query_hits_cache(self):
+        self.stats.top_scorers_by_nationality("FIN")
+        self.stats.top_scorers_by_nationality("FIN")
+        self.stats.top_scorers_by_nationality("FIN", 2)
+
+        info = self.stats.cache_info()
+
+        self.assertEqual((info.hits, info.misses), (1, 2))
+
+    def test_reload_with_new_data_invalidates_cache(self):
+        self.stats.top_scorers_by_nationality("FIN", 1)
+        self.reader.player_dicts.append(
+            {"name": "Mikko Rantanen", "nationality": "FIN", "team": "COL", "goals": 50, "assists": 60}
+        )
+        self.stats.reload()
+
+        players = self.stats.top_scorers_by_nationality("FIN", 1)
+
+        self.assertEqual(self.names(players), ["Mikko Rantanen"])
+        self.assertEqual(self.stats.cache_info().misses, 2)
+
+    def test_reads_any_shared_source(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "players.txt")
+            with open(path, "w", encoding="utf-8") as players_file:
+                players_file.write("Jari Kurri;EDM;FIN;30;40;0\nJoe Sakic;COL;CAN;40;60;0\n")
+
+            stats = PlayerStats(SourceReader(open_source(path), create_player))
+
+        self.assertEqual(self.names(stats.top_scorers_by_nationality("FIN")), ["Jari Kurri"])
@@ -0,0 +1,57 @@
+import io
+import unittest
+from rich.console import Console
+from player import Player
+from player_table import PlayerTable
+
+def create_players(count):
+    return [
+        Player({"name": f"Player {i}", "nationality": "FIN", "team": "EDM", "goals": i, "assists": 0})
+        for i in range(count)
+    ]
+
+class TestPlayerTable(unittest.TestCase):
+    def setUp(self):
+        self.output = io.StringIO()
+        self.console = Console(file=self.output, width=100, height=20)
+        self.table = PlayerTable(self.console, page_size=10)
+        self.table.show(create_players(25))
+
+    def test_only_current_page_is_visible(self):
+        names = [player.name for player in self.table.visible_players()]
+
+        self.assertEqual(names, [f"Player {i}" for i in range(10)])
+
+    def test_turning_pages_stays_within_bounds(self):
+        self.table.turn(1)
+        self.table.turn(1)
+        self.table.turn(1)
+        self.assertEqual(self.table.page, 2)
+        self.assertEqual(len(self.table.visible_players()), 5)
+
+        self.table.turn(-5)
+        self.assertEqual(self.table.page, 0)
+
+    def test_show_starts_from_first_page(self):
+        self.table.turn(1)
+        self.table.show(create_players(3))
+
+        self.assertEqual(self.table.page, 0)
+        self.assertEqual(self.table.pages, 1)
+
+    def test_render_prints_visible_rows_and_page_info(self):
+        self.table.turn(1)
+        self.table.render()
+        text = self.output.getvalue()
+
+        self.assertIn("Player 10", text)
+        self.assertNotIn("Player 9 ", text)
+        self.assertIn("25 players, page 2/3", text)
+
+    def test_row_markup_is_built_once_per_player(self):
+        player = self.table.visible_players()[0]
+
+        self.assertIs(self.table._row(player), self.table._row(player))
+
+    def test_page_size_defaults_to_console_height(self):
+        self.assertEqual(PlayerTable(self.console).page_size, 12)
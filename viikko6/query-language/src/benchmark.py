@@ -0,0 +1,173 @@
+import argparse
+import itertools
+import random
+import time
+
+from matchers import All, And, HasAtLeast, Not, Or, PlaysIn
+from player import Player
+from querybuilder import QueryBuilder
+from statistics import STRATEGIES, UNPLANNED_STRATEGIES, Statistics
+
+DEFAULT_SIZES = [10_000, 100_000]
+TEAMS = ["ANA", "BOS", "CHI", "DET", "EDM", "MTL", "NYR", "PHI", "PIT", "TOR"]
+
+
+class InMemoryReader:
+    def __init__(self, players):
+        self._players = players
+
+    def get_players(self):
+        return list(self._players)
+
+
+def synthetic_players(size, seed=2024):
+    generator = random.Random(seed)
+
+    return [
+        Player(f"Player {index}", generator.choice(TEAMS), generator.randrange(60), generator.randrange(90))
+        for index in range(size)
+    ]
+
+
+def index_query():
+    query = QueryBuilder()
+
+    return query.one_of(
+        query.plays_in("PHI").has_at_least(10, "assists").has_fewer_than(10, "goals"),
+        query.plays_in("EDM").has_at_least(50, "points")
+    ).build()
+
+
+def deep_query():
+    # QueryBuilder sisäkkäistää jokaisen ehdon uuteen And-solmuun
+    query = QueryBuilder()
+
+    for value in range(10):
+        query = query.has_at_least(value, "goals").has_fewer_than(90 - value, "assists")
+
+    return query.build()
+
+
+def unselective_first_query():
+    # halpa ja tarkka joukkue-ehto on rakennettu ketjun viimeiseksi
+    return QueryBuilder().has_at_least(1, "goals").has_fewer_than(89, "assists").has_at_least(2, "points").plays_in("PHI").build()
+
+
+def selective_query():
+    return QueryBuilder().plays_in("EDM").has_at_least(130, "points").build()
+
+
+def negated_query():
+    return And(Not(PlaysIn("BOS")), Or(HasAtLeast(40, "goals"), HasAtLeast(70, "assists")), All())
+
+
+QUERIES = {
+    "index": index_query,
+    "deep": deep_query,
+    "unselective_first": unselective_first_query,
+    "selective": selective_query,
+    "negated": negated_query
+}
+
+MODES = STRATEGIES
+
+
+def shared_batch():
+    # kojelaudan kyselyt toistavat samoja joukkue- ja pisterajaehtoja
+    scorers = Or(HasAtLeast(40, "goals"), HasAtLeast(70, "assists"))
+    queries = []
+
+    for team in TEAMS:
+        queries.append(And(PlaysIn(team), scorers))
+        queries.append(And(PlaysIn(team), Not(scorers)))
+        queries.append(And(PlaysIn(team), HasAtLeast(100, "points")))
+
+    return queries
+
+
+def run_batch(size, seed):
+    stats = Statistics(InMemoryReader(synthetic_players(size, seed)))
+    batch = shared_batch()
+    expected = [stats.matches(matcher, strategy="interpreted", plan=False) for matcher in batch]
+    results = {}
+
+    for mode in ("vectorized", "cached"):
+        if stats.matches_many(batch, strategy=mode) != expected:
+            raise AssertionError(f"{mode} differs from interpreted for the shared batch")
+
+        # kylmä välimuisti joka kierroksella, jotta mitataan vain erän sisäinen jakaminen
+        results[f"{size}/shared_batch/{mode}_ms"] = measure(lambda: stats.cache.clear() or stats.matches_many(batch, strategy=mode))
+
+    # toistuva erä samalla datalla, esim. kojelaudan päivitys
+    results[f"{size}/shared_batch/cached_warm_ms"] = measure(lambda: stats.matches_many(batch, strategy="cached"))
+
+    return results, stats.cache_info(), stats.cache.hit_rate
+
+
+def measure(function, repeat=5):
+    best = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best * 1000
+
+
+def run(sizes, seed):
+    results = {}
+
+    for size in sizes:
+        stats = Statistics(InMemoryReader(synthetic_players(size, seed)))
+
+        for query_name, create_query in QUERIES.items():
+            matcher = create_query()
+            expected = stats.matches(matcher, strategy="interpreted", plan=False)
+
+            for mode, plan in itertools.product(MODES, (False, True)):
+                if plan and mode in UNPLANNED_STRATEGIES:
+                    continue
+
+                # kaikkien tapojen on annettava täsmälleen sama tulos
+                if stats.matches(matcher, strategy=mode, plan=plan) != expected:
+                    raise AssertionError(f"{mode} differs from interpreted for {query_name}")
+
+                case = f"{size}/{query_name}/{mode}{'_planned' if plan else ''}_ms"
+                # välimuisti tyhjennetään joka kierroksella, jotta cached mitataan kylmänä kuten muut
+                results[case] = measure(lambda: stats.cache.clear() or stats.matches(matcher, strategy=mode, plan=plan))
+
+            results[f"{size}/{query_name}/cached_warm_ms"] = measure(lambda: stats.matches(matcher, strategy="cached"))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Statistics.matches() on synthetic rosters")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--seed", type=int, default=2024)
+
+    parser.add_argument("--explain", action="store_true", help="print the chosen plan of every query")
+    options = parser.parse_args()
+
+    if options.explain:
+        stats = Statistics(InMemoryReader(synthetic_players(options.sizes[0], options.seed)))
+
+        for query_name, create_query in QUERIES.items():
+            print(f"{query_name}:\n{stats.explain(create_query())}\n")
+
+    for case, value in run(options.sizes, options.seed).items():
+        print(f"{case:50} {value:10.3f}")
+
+    for size in options.sizes:
+        results, info, hit_rate = run_batch(size, options.seed)
+
+        for case, value in results.items():
+            print(f"{case:50} {value:10.3f}")
+
+        print(f"{size}/shared_batch/cache {info} hit_rate={hit_rate:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Columns:
+    # pelaajat sarakkeina, jotta matcherit voivat laskea maskin koko joukolle kerralla
+    def __init__(self, players):
+        if numpy is None:
+            raise RuntimeError("vectorized matching needs numpy: pip install numpy")
+
+        self.size = len(players)
+        self.players = numpy.empty(self.size, dtype=object)
+        self.players[:] = players
+        self._columns = {}
+        self._team_codes = None
+        self._teams = {}
+
+    def mask(self, matcher):
+        return matcher.mask(self)
+
+    def column(self, attr):
+        values = self._columns.get(attr)
+
+        if values is None:
+            values = self._columns[attr] = numpy.array([getattr(player, attr) for player in self.players])
+
+        return values
+
+    def team_mask(self, team):
+        if self._team_codes is None:
+            teams, codes = numpy.unique(self.column("team"), return_inverse=True)
+            self._teams = {name: code for code, name in enumerate(teams.tolist())}
+            self._team_codes = codes
+
+        code = self._teams.get(team)
+
+        if code is None:
+            return self.none()
+
+        return self._team_codes == code
+
+    def all(self):
+        return numpy.ones(self.size, dtype=bool)
+
+    def none(self):
+        return numpy.zeros(self.size, dtype=bool)
+
+    def select(self, mask):
+        return self.players[mask].tolist()
+
+
+class CachedColumns:
+    # samat sarakkeet, mutta jokaisen alipuun maski haetaan ensin välimuistista
+    def __init__(self, columns, cache, version):
+        self._columns = columns
+        self._cache = cache
+        self._version = version
+
+    def __getattr__(self, name):
+        return getattr(self._columns, name)
+
+    def mask(self, matcher):
+        return self._cache.get(matcher, self._version, lambda: self._read_only(matcher.mask(self)))
+
+    def _read_only(self, mask):
+        # samaa maskia käyttävät monet kyselyt, joten sitä ei saa muuttaa paikallaan
+        mask.flags.writeable = False
+        return mask
@@ -1,6 +1,106 @@
-class And:
+import keyword
+
+
+def compile_matcher(matcher):
+    # koko puu käännetään yhdeksi lambdaksi: attribuutit luetaan suoraan
+    # ja vakiot haetaan funktion globaaleista, ei oliokentistä
+    constants = {}
+
+    try:
+        source = f"lambda player: {matcher.expression(constants)}"
+        return eval(source, {"__builtins__": {"getattr": getattr}, **constants})
+    except (SyntaxError, RecursionError):
+        # hyvin syvä puu ylittää jäsentimen sulku- tai rekursiorajan; tulkittu puu antaa saman tuloksen
+        return matcher.test
+
+
+def constant(constants, value):
+    name = f"_c{len(constants)}"
+    constants[name] = value
+
+    return name
+
+
+def flatten(matchers, kind):
+    # QueryBuilderin sisäkkäiset solmut puretaan pinolla, jotta syväkään ketju ei rekursoi
+    stack = list(reversed(matchers))
+
+    while stack:
+        matcher = stack.pop()
+
+        if isinstance(matcher, kind):
+            stack.extend(reversed(matcher.children()))
+        else:
+            yield matcher
+
+
+def group(term, operators):
+    # vertailut sitovat tiukemmin kuin not, and ja or, joten sulut tarvitaan
+    # vain, jos termissä on heikommin sitova operaattori
+    if any(f" {operator} " in term for operator in operators):
+        return f"({term})"
+
+    return term
+
+
+def attribute(constants, attr):
+    if attr.isidentifier() and not keyword.iskeyword(attr):
+        return f"player.{attr}"
+
+    return f"getattr(player, {constant(constants, attr)})"
+
+
+class Matcher:
+    # rakenteellinen yhtäsuuruus: saman tyyppiset matcherit samoilla arvoilla ovat sama ehto
+    def __init__(self):
+        # matcherit ovat muuttumattomia ja lapset on jo luotu, joten tiiviste lasketaan kerran
+        self._hash = hash((type(self).__name__, self.key()))
+
+    def key(self):
+        return ()
+
+    def __eq__(self, other):
+        # verrataan pinolla, jotta syväkään QueryBuilder-ketju ei rekursoi
+        pairs = [(self, other)]
+
+        while pairs:
+            left, right = pairs.pop()
+
+            if left is right:
+                continue
+            if type(left) is not type(right) or left._hash != right._hash:
+                return False
+
+            left_key, right_key = left.key(), right.key()
+
+            if len(left_key) != len(right_key):
+                return False
+
+            for left_item, right_item in zip(left_key, right_key):
+                if isinstance(left_item, Matcher):
+                    pairs.append((left_item, right_item))
+                elif left_item != right_item:
+                    return False
+
+        return True
+
+    def __hash__(self):
+        return self._hash
+
+
+class And(Matcher):
     def __init__(self, *matchers):
         self._matchers = matchers
+        super().__init__()
+
+    def children(self):
+        return self._matchers
+
+    def key(self):
+        return self._matchers
+
+    def __repr__(self):
+        return f"And({', '.join(map(repr, self._matchers))})"
 
     def test(self, player):
         for matcher in self._matchers:
@@ -9,53 +109,175 @@ class And:
 
         return True
 
+    def terms(self, constants):
+        # sisäkkäiset And-solmut litistetään samaan ehtoketjuun
+        for matcher in flatten(self._matchers, And):
+            yield matcher.expression(constants)
+
+    def expression(self, constants):
+        terms = [term for term in self.terms(constants) if term != "True"]
+
+        if "False" in terms:
+            return "False"
+        if not terms:
+            return "True"
+
+        return " and ".join(group(term, ("or",)) for term in terms)
+
+    def mask(self, columns):
+        mask = columns.all()
+
+        for matcher in flatten(self._matchers, And):
+            mask &= columns.mask(matcher)
 
-class PlaysIn:
+        return mask
+
+
+class PlaysIn(Matcher):
     def __init__(self, team):
         self._team = team
+        super().__init__()
+
+    @property
+    def team(self):
+        return self._team
+
+    def key(self):
+        return (self._team,)
+
+    def __repr__(self):
+        return f"PlaysIn({self._team!r})"
 
     def test(self, player):
         return player.team == self._team
 
+    def expression(self, constants):
+        return f"player.team == {constant(constants, self._team)}"
 
-class HasAtLeast:
+    def mask(self, columns):
+        return columns.team_mask(self._team)
+
+
+class HasAtLeast(Matcher):
     def __init__(self, value, attr):
         self._value = value
         self._attr = attr
+        super().__init__()
+
+    @property
+    def value(self):
+        return self._value
+
+    @property
+    def attr(self):
+        return self._attr
+
+    def key(self):
+        return (self._value, self._attr)
+
+    def __repr__(self):
+        return f"HasAtLeast({self._value!r}, {self._attr!r})"
 
     def test(self, player):
         player_value = getattr(player, self._attr)
 
         return player_value >= self._value
 
+    def expression(self, constants):
+        return f"{attribute(constants, self._attr)} >= {constant(constants, self._value)}"
+
+    def mask(self, columns):
+        return columns.column(self._attr) >= self._value
+
+
+class All(Matcher):
+    def __repr__(self):
+        return "All()"
 
-class All:
     def test(self, player):
         return True
 
+    def expression(self, constants):
+        return "True"
+
+    def mask(self, columns):
+        return columns.all()
 
-class Not:
+
+class Not(Matcher):
     def __init__(self, matchers):
         self._matchers = matchers
+        super().__init__()
+
+    def children(self):
+        return (self._matchers,)
+
+    def key(self):
+        return (self._matchers,)
+
+    def __repr__(self):
+        return f"Not({self._matchers!r})"
 
     def test(self, player):
         return not self._matchers.test(player)
 
+    def expression(self, constants):
+        term = self._matchers.expression(constants)
+
+        if term in ("True", "False"):
+            return "False" if term == "True" else "True"
 
-class HasFewerThan:
+        return f"not {group(term, ('and', 'or'))}"
+
+    def mask(self, columns):
+        return ~columns.mask(self._matchers)
+
+
+class HasFewerThan(Matcher):
     def __init__(self, value, attr):
         self._value = value
         self._attr = attr
+        super().__init__()
+
+    @property
+    def value(self):
+        return self._value
+
+    @property
+    def attr(self):
+        return self._attr
+
+    def key(self):
+        return (self._value, self._attr)
+
+    def __repr__(self):
+        return f"HasFewerThan({self._value!r}, {self._attr!r})"
 
     def test(self, player):
         player_value = getattr(player, self._attr)
 
         return player_value < self._value
 
+    def expression(self, constants):
+        return f"{attribute(constants, self._attr)} < {constant(constants, self._value)}"
+
+    def mask(self, columns):
+        return columns.column(self._attr) < self._value
 
-class Or:
+
+class Or(Matcher):
     def __init__(self, *matchers):
         self._matchers = matchers
+        super().__init__()
+
+    def children(self):
+        return self._matchers
+
+    def key(self):
+        return self._matchers
+
+    def __repr__(self):
+        return f"Or({', '.join(map(repr, self._matchers))})"
 
     def test(self, player):
         for matcher in self._matchers:
@@ -63,3 +285,25 @@ class Or:
                 return True
 
         return False
+
+    def terms(self, constants):
+        for matcher in flatten(self._matchers, Or):
+            yield matcher.expression(constants)
+
+    def expression(self, constants):
+        terms = [term for term in self.terms(constants) if term != "False"]
+
+        if "True" in terms:
+            return "True"
+        if not terms:
+            return "False"
+
+        return " or ".join(terms)
+
+    def mask(self, columns):
+        mask = columns.none()
+
+        for matcher in flatten(self._matchers, Or):
+            mask |= columns.mask(matcher)
+
+        return mask
@@ -0,0 +1,177 @@
+from bisect import bisect_left
+from collections import Counter, namedtuple
+
+from matchers import All, And, HasAtLeast, HasFewerThan, Not, Or, PlaysIn, flatten
+
+NUMERIC_ATTRIBUTES = ("goals", "assists", "points")
+
+# tuntemattomasta ehdosta oletetaan, että se päästää puolet läpi
+UNKNOWN_SELECTIVITY = 0.5
+COMPARISON_COST = 1.0
+
+# osuudet arvioidaan tasavälein poimitusta otoksesta, jotta tilastot ovat halpoja
+# myös suurelle tai tilannekuvasta luetulle joukolle
+SAMPLE_SIZE = 10_000
+
+Estimate = namedtuple("Estimate", ["selectivity", "cost"])
+
+
+class Histogram:
+    # jokaisen erillisen arvon esiintymät kumulatiivisesti, joten osuus on tarkka
+    def __init__(self, values):
+        counts = Counter(values)
+        self._values = sorted(counts)
+        self._below = [0]
+
+        for value in self._values:
+            self._below.append(self._below[-1] + counts[value])
+
+    def fraction_below(self, value):
+        total = self._below[-1]
+
+        if total == 0:
+            return 0.0
+
+        return self._below[bisect_left(self._values, value)] / total
+
+
+class TableStats:
+    def __init__(self, players, sample_size=SAMPLE_SIZE):
+        step = max(1, -(-len(players) // sample_size))
+        sample = players[::step]
+
+        self.size = len(players)
+        self.sample_size = len(sample)
+        self.teams = Counter(player.team for player in sample)
+        self.histograms = {
+            attr: Histogram(getattr(player, attr) for player in sample)
+            for attr in NUMERIC_ATTRIBUTES
+        }
+
+    def team_fraction(self, team):
+        if self.sample_size == 0:
+            return 0.0
+
+        return self.teams[team] / self.sample_size
+
+    def fraction_below(self, attr, value):
+        histogram = self.histograms.get(attr)
+
+        if histogram is None:
+            return UNKNOWN_SELECTIVITY
+
+        return histogram.fraction_below(value)
+
+
+def _chain(estimates, passes):
+    # lyhytsulkeva ketju: seuraava ehto lasketaan vain, jos edellinen ei ratkaissut tulosta
+    cost = 0.0
+    reached = 1.0
+
+    for estimate in estimates:
+        cost += reached * estimate.cost
+        reached *= passes(estimate)
+
+    return cost, reached
+
+
+class Planner:
+    def __init__(self, stats):
+        self.stats = stats
+
+    def _leaf(self, matcher):
+        if isinstance(matcher, PlaysIn):
+            return Estimate(self.stats.team_fraction(matcher.team), COMPARISON_COST)
+        if isinstance(matcher, HasAtLeast):
+            return Estimate(1.0 - self.stats.fraction_below(matcher.attr, matcher.value), COMPARISON_COST)
+        if isinstance(matcher, HasFewerThan):
+            return Estimate(self.stats.fraction_below(matcher.attr, matcher.value), COMPARISON_COST)
+        if isinstance(matcher, All):
+            return Estimate(1.0, 0.0)
+
+        return Estimate(UNKNOWN_SELECTIVITY, COMPARISON_COST)
+
+    def _combine(self, matcher, estimates):
+        # solmun arvio lasketaan lasten valmiista arvioista, joten koko puu arvioidaan kerran
+        if isinstance(matcher, Not):
+            return Estimate(1.0 - estimates[0].selectivity, estimates[0].cost)
+        if isinstance(matcher, And):
+            cost, selectivity = _chain(estimates, lambda e: e.selectivity)
+            return Estimate(selectivity, cost)
+
+        cost, missed = _chain(estimates, lambda e: 1.0 - e.selectivity)
+        return Estimate(1.0 - missed, cost)
+
+    def estimate(self, matcher):
+        if isinstance(matcher, (And, Or, Not)):
+            return self._combine(matcher, [self.estimate(child) for child in matcher.children()])
+
+        return self._leaf(matcher)
+
+    def _order(self, planned, decisive):
+        # riippumattomille ehdoille optimaalinen järjestys: pienin kustannus
+        # ratkaisevaa todennäköisyyttä kohden ensin; tasatilanteessa alkuperäinen järjestys
+        def rank(child):
+            estimate = child[1]
+            probability = decisive(estimate)
+
+            return estimate.cost / probability if probability > 0 else float("inf")
+
+        return sorted(planned, key=rank)
+
+    def _plan_chain(self, matcher, kind, decisive):
+        # QueryBuilderin sisäkkäiset solmut yhdistetään, jotta kaikki ehdot voidaan järjestää yhdessä
+        children = [self._plan(child) for child in flatten(matcher.children(), kind)]
+
+        if kind is And:
+            children = [child for child in children if not isinstance(child[0], All)]
+
+        if len(children) == 1:
+            return children[0]
+
+        ordered = self._order(children, decisive)
+        planned = kind(*(child for child, _ in ordered))
+
+        return planned, self._combine(planned, [estimate for _, estimate in ordered])
+
+    def _plan(self, matcher):
+        # palauttaa suunnitelman ja sen arvion
+        if isinstance(matcher, And):
+            return self._plan_chain(matcher, And, lambda e: 1.0 - e.selectivity)
+        if isinstance(matcher, Or):
+            return self._plan_chain(matcher, Or, lambda e: e.selectivity)
+        if isinstance(matcher, Not):
+            inner, estimate = self._plan(matcher.children()[0])
+            planned = Not(inner)
+            return planned, self._combine(planned, [estimate])
+
+        return matcher, self._leaf(matcher)
+
+    def plan(self, matcher):
+        try:
+            return self._plan(matcher)[0]
+        except RecursionError:
+            # suunnitelma vain järjestää ehtoja, joten liian syvä puu ajetaan sellaisenaan
+            return matcher
+
+    def _explain(self, matcher, depth, lines):
+        position = len(lines)
+        lines.append(None)
+
+        if isinstance(matcher, (And, Or, Not)):
+            estimates = [self._explain(child, depth + 1, lines) for child in matcher.children()]
+            estimate = self._combine(matcher, estimates)
+            label = type(matcher).__name__
+        else:
+            estimate = self._leaf(matcher)
+            label = repr(matcher)
+
+        lines[position] = f"{'  ' * depth}{label}  selectivity={estimate.selectivity:.3f} cost={estimate.cost:.2f}"
+
+        return estimate
+
+    def explain(self, matcher):
+        lines = []
+        self._explain(matcher, 0, lines)
+
+        return "\n".join(lines)
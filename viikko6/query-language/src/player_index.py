@@ -0,0 +1,123 @@
+from bisect import bisect_left
+from collections import namedtuple
+
+from matchers import And, HasAtLeast, HasFewerThan, Or, PlaysIn, flatten
+
+SORTED_ATTRIBUTES = ("goals", "assists", "points")
+
+# pienempi ehdokasjoukko leikataan isomman kanssa vain, jos isompi ei ole tätä kertaa suurempi;
+# muuten on halvempaa tarkistaa ehdokkaat käännetyllä predikaatilla
+INTERSECT_RATIO = 8
+
+# rivi-indeksit: arvioitu koko ja funktio, joka antaa rivit; koko arvioidaan
+# suunnittelijan tilastoista, joten indeksi rakennetaan vasta kun rivejä todella pyydetään
+Candidates = namedtuple("Candidates", ["size", "rows"])
+
+
+class SortedIndex:
+    def __init__(self, players, attr):
+        self.rows = sorted(range(len(players)), key=lambda row: getattr(players[row], attr))
+        self.values = [getattr(players[row], attr) for row in self.rows]
+
+    def at_least(self, value):
+        return self.rows[bisect_left(self.values, value):]
+
+    def fewer_than(self, value):
+        return self.rows[:bisect_left(self.values, value)]
+
+
+class PlayerIndexes:
+    def __init__(self, players, stats):
+        self.size = len(players)
+        self._players = players
+        self._stats = stats
+        self._teams = None
+        self._sorted = {}
+
+    def teams(self):
+        if self._teams is None:
+            self._teams = {}
+
+            for row, player in enumerate(self._players):
+                self._teams.setdefault(player.team, []).append(row)
+
+        return self._teams
+
+    def sorted_index(self, attr):
+        if attr not in SORTED_ATTRIBUTES:
+            return None
+
+        if attr not in self._sorted:
+            self._sorted[attr] = SortedIndex(self._players, attr)
+
+        return self._sorted[attr]
+
+    def _estimate(self, fraction):
+        return round(fraction * self.size)
+
+    def _range(self, matcher, bound, fraction):
+        if matcher.attr not in SORTED_ATTRIBUTES:
+            return None
+
+        return Candidates(self._estimate(fraction), lambda: bound(self.sorted_index(matcher.attr), matcher.value))
+
+    def _team(self, matcher):
+        fraction = self._stats.team_fraction(matcher.team)
+
+        return Candidates(self._estimate(fraction), lambda: self.teams().get(matcher.team, []))
+
+    def _and(self, matcher):
+        # pienimmästä joukosta aloittaen; indeksoimattomat ehdot jäävät tarkistukseen
+        parts = sorted(filter(None, map(self.candidates, flatten(matcher.children(), And))), key=lambda part: part.size)
+
+        if not parts:
+            return None
+
+        if len(parts) == 1:
+            return parts[0]
+
+        def rows():
+            result = set(parts[0].rows())
+
+            for part in parts[1:]:
+                if part.size > len(result) * INTERSECT_RATIO:
+                    break
+                result.intersection_update(part.rows())
+
+            return result
+
+        return Candidates(parts[0].size, rows)
+
+    def _or(self, matcher):
+        parts = [self.candidates(child) for child in flatten(matcher.children(), Or)]
+
+        if None in parts:
+            return None
+
+        def rows():
+            result = set()
+
+            for part in parts:
+                result.update(part.rows())
+
+            return result
+
+        return Candidates(sum(part.size for part in parts), rows)
+
+    def candidates(self, matcher):
+        # ehdokkaat ovat aina ylijoukko osumista, joten lopputulos tarkistetaan vielä matcherilla;
+        # None tarkoittaa, ettei ehtoa voi rajata indekseillä
+        if isinstance(matcher, PlaysIn):
+            return self._team(matcher)
+        if isinstance(matcher, HasAtLeast):
+            below = self._stats.fraction_below(matcher.attr, matcher.value)
+            return self._range(matcher, SortedIndex.at_least, 1.0 - below)
+        if isinstance(matcher, HasFewerThan):
+            below = self._stats.fraction_below(matcher.attr, matcher.value)
+            return self._range(matcher, SortedIndex.fewer_than, below)
+        if isinstance(matcher, And):
+            return self._and(matcher)
+        if isinstance(matcher, Or):
+            return self._or(matcher)
+
+        return None
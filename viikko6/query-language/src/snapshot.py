@@ -0,0 +1,43 @@
+from nhl_sources import SnapshotSource
+from player import Player
+
+
+class SnapshotPlayer:
+    # kentät luetaan tilannekuvasta vasta, kun niitä käytetään
+    __slots__ = ("_snapshot", "_row")
+
+    def __init__(self, snapshot, row):
+        self._snapshot = snapshot
+        self._row = row
+
+    @property
+    def name(self):
+        return self._snapshot.name(self._row)
+
+    @property
+    def team(self):
+        return self._snapshot.teams[self._snapshot.team_codes[self._row]]
+
+    @property
+    def goals(self):
+        return self._snapshot.goals[self._row]
+
+    @property
+    def assists(self):
+        return self._snapshot.assists[self._row]
+
+    @property
+    def points(self):
+        return self.goals + self.assists
+
+    __str__ = Player.__str__
+
+
+class SnapshotReader:
+    def __init__(self, path):
+        self._path = path
+
+    def get_players(self):
+        snapshot = SnapshotSource(self._path).snapshot()
+
+        return [SnapshotPlayer(snapshot, row) for row in range(len(snapshot))]
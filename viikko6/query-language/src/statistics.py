@@ -1,12 +1,54 @@
+from nhl_sources import ResultCache
 from player_reader import PlayerReader
+from matchers import compile_matcher
+from columns import CachedColumns, Columns, numpy
+from planner import Planner, TableStats
+from player_index import PlayerIndexes
+
+STRATEGIES = ("interpreted", "compiled", "vectorized", "indexed", "cached")
+MASK_STRATEGIES = ("vectorized", "cached")
+# tulkittu haku on vertailukohta, joten sitä ei järjestetä; maskeissa järjestyksellä ei ole väliä
+UNPLANNED_STRATEGIES = ("interpreted",) + MASK_STRATEGIES
+
+# ehdokasrivi maksaa joukkoon lisäämisen, järjestämisen ja tarkistuksen verran, joten
+# yli kymmenesosan ehdokasjoukolla koko listan läpikäynti käännetyllä predikaatilla on halvempaa;
+# koko arvioidaan tilastoista ennen kuin yhtään indeksiä rakennetaan
+INDEX_SCAN_RATIO = 0.1
+
 
 def sort_by_points(player):
     return player.points
 
 
 class Statistics:
-    def __init__(self, player_reader):
-        self._players = player_reader.get_players()
+    def __init__(self, player_reader, cache_size=128):
+        self._reader = player_reader
+        self.version = 0
+        self.cache = ResultCache(cache_size)
+        self.reload()
+
+    def reload(self):
+        # uusi versio mitätöi välimuistin tulokset, indeksit rakennetaan uudelleen tarvittaessa
+        self._players = self._reader.get_players()
+        self._indexes = {}
+        self._columns = None
+        self._player_indexes = None
+        self._planner = None
+        self.version += 1
+
+    def _index(self, field):
+        if field not in self._indexes:
+            index = {}
+
+            for player in self._players:
+                index.setdefault(getattr(player, field), []).append(player)
+
+            self._indexes[field] = index
+
+        return self._indexes[field]
+
+    def players_by(self, field, value):
+        return list(self._index(field).get(value, []))
 
     def search(self, name):
         for player in self._players:
@@ -16,12 +58,7 @@ class Statistics:
         return None
 
     def team(self, team_name):
-        players_of_team = filter(
-            lambda player: player.team == team_name,
-            self._players
-        )
-
-        return list(players_of_team)
+        return self.players_by("team", team_name)
 
     def top_scorers(self, how_many):
         sorted_players = sorted(
@@ -32,10 +69,91 @@ class Statistics:
 
         return sorted_players[:how_many]
 
-    def matches(self, matcher):
-        matching_players = filter(
-            lambda player: matcher.test(player),
-            self._players
-        )
+    def columns(self):
+        if self._columns is None:
+            self._columns = Columns(self._players)
+
+        return self._columns
+
+    def player_indexes(self):
+        if self._player_indexes is None:
+            self._player_indexes = PlayerIndexes(self._players, self.planner().stats)
+
+        return self._player_indexes
+
+    def _matches_indexed(self, matcher):
+        predicate = compile_matcher(matcher)
+
+        try:
+            candidates = self.player_indexes().candidates(matcher)
+        except RecursionError:
+            # vuorottelevat And- ja Or-tasot rekursoivat; silloin käydään kaikki rivit läpi
+            candidates = None
+
+        if candidates is None or candidates.size > len(self._players) * INDEX_SCAN_RATIO:
+            return list(filter(predicate, self._players))
+
+        # rivit järjestetään, jotta tulos on samassa järjestyksessä kuin läpikäynnissä
+        players = (self._players[row] for row in sorted(candidates.rows()))
+
+        return list(filter(predicate, players))
+
+    def planner(self):
+        # tilastot kerätään vasta ensimmäiselle suunnitelmalle, koska ne lukevat
+        # jokaisen pelaajan jokaisen kentän (tilannekuvassa koko tiedoston)
+        if self._planner is None:
+            self._planner = Planner(TableStats(self._players))
+
+        return self._planner
+
+    def plan(self, matcher):
+        return self.planner().plan(matcher)
+
+    def explain(self, matcher):
+        return self.planner().explain(self.plan(matcher))
+
+    def _matches_cached_rows(self, matcher, plan):
+        # ilman numpya alipuiden maskeja ei ole, joten muistetaan kokonaisten kyselyjen tulosrivit
+        def compute():
+            return tuple(filter(compile_matcher(self.plan(matcher) if plan else matcher), self._players))
+
+        return list(self.cache.get(matcher, self.version, compute))
+
+    def matches(self, matcher, strategy="compiled", plan=True):
+        # kaikki tavat antavat saman tuloksen kuin matcher.test;
+        # ilman numpya vektoroitu haku tehdään käännetyllä predikaatilla
+        if strategy not in STRATEGIES:
+            raise ValueError(f"unknown strategy {strategy}")
+
+        if strategy == "cached" and numpy is None:
+            return self._matches_cached_rows(matcher, plan)
+
+        if plan and strategy not in UNPLANNED_STRATEGIES:
+            matcher = self.plan(matcher)
+
+        if strategy in MASK_STRATEGIES and numpy is not None:
+            columns = self.columns()
+
+            if strategy == "cached":
+                columns = CachedColumns(columns, self.cache, self.version)
+
+            try:
+                return columns.select(columns.mask(matcher))
+            except RecursionError:
+                # litistämättömät tasot rekursoivat maskeissa; käännetty predikaatti kestää syvemmän puun
+                strategy = "compiled"
+
+        if strategy == "interpreted":
+            return list(filter(matcher.test, self._players))
+
+        if strategy == "indexed":
+            return self._matches_indexed(matcher)
+
+        return list(filter(compile_matcher(matcher), self._players))
+
+    def matches_many(self, matchers, strategy="cached"):
+        # yhteiset alipuut lasketaan erässä vain kerran
+        return [self.matches(matcher, strategy) for matcher in matchers]
 
-        return list(matching_players)
+    def cache_info(self):
+        return self.cache.info()
@@ -0,0 +1,95 @@
+from types import SimpleNamespace
+from matchers import All, And, HasAtLeast, HasFewerThan, Not, Or, PlaysIn, compile_matcher
+from querybuilder import QueryBuilder
+import unittest
+
+KURRI = SimpleNamespace(name="Kurri", team="EDM", goals=37, assists=53, points=90)
+
+class TestCompileMatcher(unittest.TestCase):
+    def expression(self, matcher):
+        return matcher.expression({})
+
+    def test_not_all_folds_to_false(self):
+        self.assertEqual(self.expression(Not(All())), "False")
+        self.assertEqual(self.expression(Not(Not(All()))), "True")
+        self.assertFalse(compile_matcher(Not(All()))(KURRI))
+
+    def test_empty_and_matches_everything(self):
+        self.assertEqual(self.expression(And()), "True")
+        self.assertTrue(compile_matcher(And())(KURRI))
+        self.assertTrue(And().test(KURRI))
+
+    def test_empty_or_matches_nothing(self):
+        self.assertEqual(self.expression(Or()), "False")
+        self.assertFalse(compile_matcher(Or())(KURRI))
+        self.assertFalse(Or().test(KURRI))
+
+    def test_constants_fold_through_and_or(self):
+        self.assertEqual(self.expression(And(PlaysIn("EDM"), Not(All()))), "False")
+        self.assertEqual(self.expression(Or(PlaysIn("EDM"), All())), "True")
+        self.assertEqual(self.expression(And(All(), Or())), "False")
+
+    def test_nested_and_is_flattened(self):
+        matcher = QueryBuilder().plays_in("EDM").has_at_least(30, "goals").build()
+        self.assertEqual(self.expression(matcher).count(" and "), 1)
+
+    def test_comparisons_are_not_parenthesised(self):
+        self.assertEqual(self.expression(And(PlaysIn("EDM"), HasAtLeast(30, "goals"))).count("("), 0)
+        self.assertEqual(self.expression(Or(And(PlaysIn("EDM"), Not(PlaysIn("PIT"))), PlaysIn("DET"))).count("("), 0)
+        self.assertEqual(self.expression(And(PlaysIn("EDM"), Or(PlaysIn("PIT"), PlaysIn("DET")))).count("("), 1)
+
+    def test_parentheses_follow_precedence(self):
+        matcher = And(Or(PlaysIn("EDM"), PlaysIn("PIT")), Not(And(PlaysIn("EDM"), HasAtLeast(40, "goals"))))
+        lemieux = SimpleNamespace(name="Lemieux", team="PIT", goals=45, assists=54, points=99)
+
+        for player in (KURRI, lemieux):
+            self.assertEqual(compile_matcher(matcher)(player), matcher.test(player))
+
+    def test_too_deep_tree_falls_back_to_test(self):
+        matcher = HasAtLeast(1, "goals")
+
+        for level in range(400):
+            matcher = And(matcher, HasAtLeast(level % 50, "assists")) if level % 2 else Or(matcher, PlaysIn("EDM"))
+
+        self.assertEqual(compile_matcher(matcher), matcher.test)
+
+    def test_non_identifier_attributes(self):
+        player = SimpleNamespace(**{"plus-minus": 12, "class": 3, "1st": 5})
+
+        for attr in ("plus-minus", "class", "1st"):
+            self.assertTrue(compile_matcher(HasAtLeast(3, attr))(player))
+            self.assertFalse(compile_matcher(HasFewerThan(3, attr))(player))
+
+    def test_values_are_not_inlined_as_source(self):
+        matcher = PlaysIn("EDM') or ('x")
+        self.assertFalse(compile_matcher(matcher)(KURRI))
+
+class TestMatcherEquality(unittest.TestCase):
+    def test_same_query_built_twice_is_equal(self):
+        first = QueryBuilder().plays_in("PHI").has_at_least(10, "goals").build()
+        second = QueryBuilder().plays_in("PHI").has_at_least(10, "goals").build()
+
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+
+    def test_different_matchers_are_not_equal(self):
+        self.assertNotEqual(HasAtLeast(10, "goals"), HasFewerThan(10, "goals"))
+        self.assertNotEqual(HasAtLeast(10, "goals"), HasAtLeast(10, "assists"))
+        self.assertNotEqual(And(PlaysIn("PHI")), Or(PlaysIn("PHI")))
+        self.assertEqual(len({PlaysIn("PHI"), PlaysIn("PHI"), Not(PlaysIn("PHI")), All(), All()}), 3)
+
+    def test_deep_chains_are_compared_without_recursion(self):
+        def chain(last):
+            query = QueryBuilder()
+
+            for level in range(2000):
+                query = query.has_at_least(level % 20, "goals")
+
+            return query.has_at_least(last, "goals").build()
+
+        self.assertEqual(chain(5), chain(5))
+        self.assertEqual(hash(chain(5)), hash(chain(5)))
+        self.assertNotEqual(chain(5), chain(6))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import tempfile
+from nhl_sources import write_snapshot
+from matchers import And, HasAtLeast, PlaysIn
+from snapshot import SnapshotReader
+from statistics import STRATEGIES, Statistics
+import unittest
+
+ROWS = [
+    ("Semenko", "EDM", "CAN", 4, 12),
+    ("Lemieux", "PIT", "CAN", 45, 54),
+    ("Kurri", "EDM", "FIN", 37, 53),
+    ("Yzerman", "DET", "CAN", 42, 56),
+    ("Gretzky", "EDM", "CAN", 35, 89)
+]
+
+class TestSnapshotReader(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "players.snap")
+        write_snapshot(ROWS, self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_players_read_fields_from_snapshot(self):
+        players = SnapshotReader(self.path).get_players()
+
+        self.assertEqual(len(players), 5)
+        self.assertEqual((players[2].name, players[2].team, players[2].points), ("Kurri", "EDM", 90))
+        self.assertEqual(str(players[2]), "Kurri                EDM          37 + 53 = 90")
+
+    def test_statistics_from_snapshot(self):
+        stats = Statistics(SnapshotReader(self.path))
+        matcher = And(PlaysIn("EDM"), HasAtLeast(40, "points"))
+
+        self.assertEqual([player.name for player in stats.team("EDM")], ["Semenko", "Kurri", "Gretzky"])
+
+        for strategy in STRATEGIES:
+            self.assertEqual([player.name for player in stats.matches(matcher, strategy)], ["Kurri", "Gretzky"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+import random
+from types import SimpleNamespace
+from unittest import mock
+from matchers import All, And, HasAtLeast, HasFewerThan, Not, Or, PlaysIn
+from player import Player
+from querybuilder import QueryBuilder
+from statistics import STRATEGIES, Statistics
+import statistics
+import unittest
+
+TEAMS = ["EDM", "PIT", "DET", "PHI"]
+ATTRIBUTES = ["goals", "assists", "points"]
+
+class PlayerReaderStub:
+    def __init__(self, players):
+        self.players = players
+
+    def get_players(self):
+        return list(self.players)
+
+def random_players(generator, size):
+    return [
+        Player(f"Player {index}", generator.choice(TEAMS), generator.randrange(60), generator.randrange(90))
+        for index in range(size)
+    ]
+
+def random_matcher(generator, depth=0):
+    kind = generator.randrange(7 if depth < 4 else 4)
+
+    if kind == 0:
+        return PlaysIn(generator.choice(TEAMS + ["XXX"]))
+    if kind == 1:
+        return HasAtLeast(generator.randrange(150), generator.choice(ATTRIBUTES))
+    if kind == 2:
+        return HasFewerThan(generator.randrange(40), generator.choice(ATTRIBUTES))
+    if kind == 3:
+        return All()
+    if kind == 4:
+        return Not(random_matcher(generator, depth + 1))
+
+    children = [random_matcher(generator, depth + 1) for _ in range(generator.randrange(4))]
+
+    return And(*children) if kind == 5 else Or(*children)
+
+def alternating_matcher(depth):
+    # vuorottelevat And- ja Or-tasot, joita ei voi litistää
+    matcher = HasAtLeast(1, "goals")
+
+    for level in range(depth):
+        matcher = And(matcher, HasAtLeast(level % 50, "assists")) if level % 2 else Or(matcher, PlaysIn("EDM"))
+
+    return matcher
+
+class TestStrategies(unittest.TestCase):
+    def setUp(self):
+        self.generator = random.Random(2024)
+        self.reader = PlayerReaderStub(random_players(self.generator, 2000))
+        self.stats = Statistics(self.reader)
+
+    def assert_all_strategies(self, matcher):
+        expected = [player for player in self.reader.players if matcher.test(player)]
+
+        for strategy in STRATEGIES:
+            for plan in (False, True):
+                self.assertEqual(
+                    self.stats.matches(matcher, strategy, plan),
+                    expected,
+                    f"{strategy} plan={plan} {matcher!r}"
+                )
+
+    def test_random_trees(self):
+        for _ in range(300):
+            self.assert_all_strategies(random_matcher(self.generator))
+
+    def test_query_builder(self):
+        query = QueryBuilder()
+        self.assert_all_strategies(query.one_of(
+            query.plays_in("PHI").has_at_least(10, "assists").has_fewer_than(10, "goals"),
+            query.plays_in("EDM").has_at_least(50, "points")
+        ).build())
+
+    def test_constant_trees(self):
+        for matcher in (All(), Not(All()), And(), Or(), Not(And()), Or(Not(All()), And())):
+            self.assert_all_strategies(matcher)
+
+    def test_deep_alternating_tree(self):
+        for depth in (120, 400):
+            matcher = alternating_matcher(depth)
+            expected = [player for player in self.reader.players if matcher.test(player)]
+
+            self.assertEqual(self.stats.matches(matcher, "compiled", plan=False), expected)
+
+    def test_deep_tree_is_run_unplanned(self):
+        matcher = alternating_matcher(400)
+        expected = [player for player in self.reader.players if matcher.test(player)]
+
+        self.assertEqual(self.stats.plan(matcher), matcher)
+        self.assertEqual(self.stats.matches(matcher, "compiled"), expected)
+        self.assertEqual(self.stats.matches(matcher, "indexed"), expected)
+
+    def test_deep_query_builder_chain(self):
+        query = QueryBuilder()
+
+        for level in range(500):
+            query = query.has_at_least(level % 20, "goals")
+
+        matcher = query.build()
+        expected = [player for player in self.reader.players if matcher.test(player)]
+
+        for strategy in STRATEGIES:
+            for plan in (False, True):
+                self.assertEqual(self.stats.matches(matcher, strategy, plan=plan), expected, strategy)
+
+    def test_too_deep_tree_for_masks(self):
+        matcher = alternating_matcher(600)
+        expected = [player for player in self.reader.players if matcher.test(player)]
+
+        self.assertEqual(self.stats.matches(matcher, "vectorized"), expected)
+
+    def test_unknown_team(self):
+        self.assertEqual(self.stats.team("XXX"), [])
+        self.assert_all_strategies(PlaysIn("XXX"))
+        self.assert_all_strategies(Or(PlaysIn("XXX"), HasAtLeast(140, "points")))
+
+    def test_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            self.stats.matches(All(), "magic")
+
+    def test_explain_lists_every_term(self):
+        explained = self.stats.explain(And(PlaysIn("EDM"), HasAtLeast(50, "goals")))
+
+        self.assertIn("PlaysIn('EDM')", explained)
+        self.assertIn("HasAtLeast(50, 'goals')", explained)
+
+class TestEdgeCases(unittest.TestCase):
+    def test_empty_roster(self):
+        stats = Statistics(PlayerReaderStub([]))
+
+        for strategy in STRATEGIES:
+            for matcher in (All(), PlaysIn("EDM"), And(PlaysIn("EDM"), HasAtLeast(1, "goals")), Not(Or())):
+                self.assertEqual(stats.matches(matcher, strategy), [])
+
+    def test_non_identifier_attributes(self):
+        players = [
+            SimpleNamespace(name="Kurri", team="EDM", goals=37, assists=53, points=90, **{"plus-minus": 12}),
+            SimpleNamespace(name="Semenko", team="EDM", goals=4, assists=12, points=16, **{"plus-minus": -3})
+        ]
+        stats = Statistics(PlayerReaderStub(players))
+
+        for strategy in STRATEGIES:
+            self.assertEqual(stats.matches(HasAtLeast(0, "plus-minus"), strategy), players[:1])
+            self.assertEqual(stats.matches(And(PlaysIn("EDM"), HasFewerThan(0, "plus-minus")), strategy), players[1:])
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        self.reader = PlayerReaderStub([
+            Player("Semenko", "EDM", 4, 12),
+            Player("Kurri", "EDM", 37, 53),
+            Player("Lemieux", "PIT", 45, 54)
+        ])
+        self.stats = Statistics(self.reader)
+
+    def names(self, players):
+        return [player.name for player in players]
+
+    def test_shared_subtrees_are_reused(self):
+        scorers = Or(HasAtLeast(40, "goals"), HasAtLeast(50, "assists"))
+        batch = [And(PlaysIn("EDM"), scorers), And(PlaysIn("PIT"), scorers), And(PlaysIn("EDM"), scorers)]
+
+        results = self.stats.matches_many(batch)
+
+        self.assertEqual([self.names(players) for players in results], [["Kurri"], ["Lemieux"], ["Kurri"]])
+        self.assertGreater(self.stats.cache_info().hits, 0)
+
+    def test_cached_mask_is_not_changed_by_other_queries(self):
+        self.stats.matches(PlaysIn("EDM"), "cached")
+        self.stats.matches(Not(PlaysIn("EDM")), "cached")
+
+        self.assertEqual(self.names(self.stats.matches(PlaysIn("EDM"), "cached")), ["Semenko", "Kurri"])
+
+    def test_reload_invalidates_cached_results(self):
+        for strategy in STRATEGIES:
+            self.reader.players = self.reader.players[:3]
+            self.stats.reload()
+            self.assertEqual(len(self.stats.matches(PlaysIn("EDM"), strategy)), 2)
+
+            self.reader.players = self.reader.players + [Player("Gretzky", "EDM", 35, 89)]
+            self.stats.reload()
+            self.assertEqual(self.names(self.stats.matches(PlaysIn("EDM"), strategy)), ["Semenko", "Kurri", "Gretzky"])
+
+    def test_cached_without_numpy_keeps_result_rows(self):
+        with mock.patch.object(statistics, "numpy", None):
+            batch = [PlaysIn("EDM"), PlaysIn("EDM")]
+
+            self.assertEqual([self.names(players) for players in self.stats.matches_many(batch)], [["Semenko", "Kurri"]] * 2)
+            self.assertEqual(self.stats.cache_info().hits, 1)
+
+            self.reader.players = self.reader.players[1:]
+            self.stats.reload()
+            self.assertEqual(self.names(self.stats.matches(PlaysIn("EDM"), "cached")), ["Kurri"])
+
+if __name__ == "__main__":
+    unittest.main()